@@ -33,6 +33,7 @@ async def async_setup_entry(
 ) -> None:
     """Set up ecoNEXT button entities from a config entry."""
     coordinator: EconextCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
 
     entities: list[ButtonEntity] = []
 
@@ -42,7 +43,7 @@ async def async_setup_entry(
         for description in HEATPUMP_BUTTONS:
             if coordinator.get_param(description.param_id) is not None:
                 entities.append(EconextButton(coordinator, description, device_id="heatpump"))
-            else:
+            elif debug_enabled:
                 _LOGGER.debug(
                     "Skipping heat pump button %s - parameter %s not found",
                     description.key,
@@ -3,6 +3,7 @@
 import logging
 from dataclasses import dataclass
 from enum import IntEnum
+from typing import ClassVar
 
 from homeassistant.components.climate import (
     ATTR_TEMPERATURE,
@@ -26,6 +27,13 @@ _LOGGER = logging.getLogger(__name__)
 # Custom preset for schedule mode
 PRESET_SCHEDULE = "schedule"
 
+# Heating/cooling enable masks in the circuit settings bitmap (CircuitXSettings)
+SETTINGS_HEATING_DISABLED = 1 << 20  # Bit 20: heating enable (inverted: 0=on, 1=off)
+SETTINGS_COOLING_ENABLED = 1 << 17  # Bit 17: cooling enable (0=off, 1=on)
+
+# HVAC mode indexed by (heating disabled << 1) | cooling enabled; neither enabled falls back to HEAT
+_HVAC_MODE_BY_SETTINGS_BITS = (HVACMode.HEAT, HVACMode.AUTO, HVACMode.HEAT, HVACMode.COOL)
+
 
 class CircuitWorkState(IntEnum):
     """Circuit work state values."""
@@ -383,6 +391,9 @@ CIRCUITS = {
     ),
 }
 
+# Device IDs for circuit devices, built once instead of per entity at setup
+CIRCUIT_DEVICE_IDS: dict[int, str] = {circuit_num: f"circuit_{circuit_num}" for circuit_num in CIRCUITS}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -392,36 +403,22 @@ async def async_setup_entry(
     """Set up ecoNEXT climate entities from a config entry."""
     coordinator: EconextCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
-    entities: list[CircuitClimate] = []
-
-    # Check each circuit
-    for circuit_num, circuit in CIRCUITS.items():
-        # Check if circuit is active
-        active = coordinator.get_param(circuit.active_param)
-        if active and active.get("value", 0) > 0:
-            entities.append(
-                CircuitClimate(
-                    coordinator,
-                    circuit_num,
-                    circuit.name_param,
-                    circuit.work_state_param,
-                    circuit.settings_param,
-                    circuit.thermostat_param,
-                    circuit.comfort_param,
-                    circuit.eco_param,
-                    circuit.room_temp_setpoint_param,
-                    circuit.boost_time_left_param,
-                )
-            )
-            _LOGGER.debug("Adding climate entity for Circuit %s", circuit_num)
-        else:
-            _LOGGER.debug(
-                "Skipping Circuit %s - not active (param %s)",
-                circuit_num,
-                circuit.active_param,
-            )
-
-    async_add_entities(entities)
+    # Add a climate entity for each active circuit
+    async_add_entities(
+        CircuitClimate(
+            coordinator,
+            circuit_num,
+            circuit.name_param,
+            circuit.work_state_param,
+            circuit.settings_param,
+            circuit.thermostat_param,
+            circuit.comfort_param,
+            circuit.eco_param,
+            circuit.room_temp_setpoint_param,
+            circuit.boost_time_left_param,
+        )
+        for circuit_num, circuit in coordinator.get_active_circuits(CIRCUITS)
+    )
 
 
 class CircuitClimate(EconextEntity, ClimateEntity):
@@ -433,6 +430,10 @@ class CircuitClimate(EconextEntity, ClimateEntity):
     _attr_max_temp = 35.0
     _attr_target_temperature_step = 0.1
 
+    # Built once and shared by all instances; hvac_modes hands out copies
+    _HVAC_MODES: ClassVar[tuple[HVACMode, ...]] = (HVACMode.OFF, HVACMode.AUTO, HVACMode.HEAT)
+    _HVAC_MODES_WITH_COOL: ClassVar[tuple[HVACMode, ...]] = (*_HVAC_MODES, HVACMode.COOL)
+
     @property
     def supported_features(self) -> int:
         """Return the list of supported features."""
@@ -453,7 +454,7 @@ class CircuitClimate(EconextEntity, ClimateEntity):
     ) -> None:
         """Initialize the climate entity."""
         # Use work_state_param as primary param for entity base
-        super().__init__(coordinator, work_state_param, f"circuit_{circuit_num}")
+        super().__init__(coordinator, work_state_param, CIRCUIT_DEVICE_IDS[circuit_num])
 
         self._circuit_num = circuit_num
         self._name_param = name_param
@@ -487,14 +488,11 @@ class CircuitClimate(EconextEntity, ClimateEntity):
         HEAT: force heating only
         COOL: force cooling only (requires cooling_support enabled globally)
         """
-        modes = [HVACMode.OFF, HVACMode.AUTO, HVACMode.HEAT]
-
         # Only offer COOL if cooling_support (param 485) is globally enabled
         cooling_support_param = self.coordinator.get_param("485")
         if cooling_support_param and int(cooling_support_param.get("value", 0)):
-            modes.append(HVACMode.COOL)
-
-        return modes
+            return list(self._HVAC_MODES_WITH_COOL)
+        return list(self._HVAC_MODES)
 
     @property
     def current_temperature(self) -> float | None:
@@ -543,21 +541,8 @@ class CircuitClimate(EconextEntity, ClimateEntity):
 
         settings_value = int(settings_param.get("value", 0))
 
-        # Check bit 20: heating enable (inverted: 0=on, 1=off)
-        heating_enabled = ((settings_value >> 20) & 1) == 0
-
-        # Check bit 17: cooling enable (0=off, 1=on)
-        cooling_enabled = ((settings_value >> 17) & 1) == 1
-
-        # Determine HVAC mode
-        if heating_enabled and cooling_enabled:
-            return HVACMode.AUTO
-        elif heating_enabled:
-            return HVACMode.HEAT
-        elif cooling_enabled:
-            return HVACMode.COOL
-        else:
-            return HVACMode.HEAT  # Default fallback
+        # Pack bit 20 (heating disabled) and bit 17 (cooling enabled) into the 2-bit table index
+        return _HVAC_MODE_BY_SETTINGS_BITS[(settings_value >> 19) & 0b10 | (settings_value >> 17) & 0b01]
 
     # Per-circuit pump status params from the heat pump controller.
     # HPStatusCircPStat0 (1353) = circuit 1, HPStatusCircPStat1 (1354) = circuit 2, etc.
@@ -692,17 +677,17 @@ class CircuitClimate(EconextEntity, ClimateEntity):
             _LOGGER.error("Unsupported HVAC mode: %s", hvac_mode)
             return
 
-        # Update bit 20: heating enable (inverted: 0=on, 1=off)
+        # Update heating enable (inverted: clear bit = ON)
         if heating_enabled:
-            settings_value &= ~(1 << 20)  # Clear bit = ON
+            settings_value &= ~SETTINGS_HEATING_DISABLED
         else:
-            settings_value |= 1 << 20  # Set bit = OFF
+            settings_value |= SETTINGS_HEATING_DISABLED
 
-        # Update bit 17: cooling enable (0=off, 1=on)
+        # Update cooling enable (set bit = ON)
         if cooling_enabled:
-            settings_value |= 1 << 17  # Set bit = ON
+            settings_value |= SETTINGS_COOLING_ENABLED
         else:
-            settings_value &= ~(1 << 17)  # Clear bit = OFF
+            settings_value &= ~SETTINGS_COOLING_ENABLED
 
         _LOGGER.debug(
             "Setting Circuit %s HVAC mode to %s (heating=%s, cooling=%s, settings=0x%X)",
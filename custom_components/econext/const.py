@@ -3,6 +3,7 @@
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import StrEnum
+import sys
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.const import (
@@ -974,7 +975,7 @@ HEATPUMP_SWITCHES: tuple[EconextSwitchEntityDescription, ...] = (
 
 # Silent mode schedule entities - bitfield for 30-minute time slots
 # Generated programmatically to reduce repetition
-_SILENT_MODE_SCHEDULE_DAYS = [
+_SILENT_MODE_SCHEDULE_DAYS = (
     ("sunday", 1387, 1388),
     ("monday", 1389, 1390),
     ("tuesday", 1391, 1392),
@@ -982,7 +983,7 @@ _SILENT_MODE_SCHEDULE_DAYS = [
     ("thursday", 1395, 1396),
     ("friday", 1397, 1398),
     ("saturday", 1399, 1400),
-]
+)
 
 SILENT_MODE_SCHEDULE_NUMBERS: tuple[EconextNumberEntityDescription, ...] = tuple(
     EconextNumberEntityDescription(
@@ -1017,7 +1018,7 @@ SILENT_MODE_SCHEDULE_DIAGNOSTIC_SENSORS: tuple[EconextSensorEntityDescription, .
 
 # Heat pump schedule entities - bitfield for 30-minute time slots
 # Generated programmatically to reduce repetition
-_HEATPUMP_SCHEDULE_DAYS = [
+_HEATPUMP_SCHEDULE_DAYS = (
     ("sunday", 926, 927),
     ("monday", 928, 929),
     ("tuesday", 930, 931),
@@ -1025,7 +1026,7 @@ _HEATPUMP_SCHEDULE_DAYS = [
     ("thursday", 934, 935),
     ("friday", 936, 937),
     ("saturday", 938, 939),
-]
+)
 
 HEATPUMP_SCHEDULE_NUMBERS: tuple[EconextNumberEntityDescription, ...] = tuple(
     EconextNumberEntityDescription(
@@ -1183,7 +1184,7 @@ DHW_NUMBERS: tuple[EconextNumberEntityDescription, ...] = (
 
 # DHW schedule entities - bitfield for 30-minute time slots
 # Generated programmatically to reduce repetition
-_DHW_SCHEDULE_DAYS = [
+_DHW_SCHEDULE_DAYS = (
     ("sunday", 120, 121),
     ("monday", 122, 123),
     ("tuesday", 124, 125),
@@ -1191,7 +1192,7 @@ _DHW_SCHEDULE_DAYS = [
     ("thursday", 128, 129),
     ("friday", 130, 131),
     ("saturday", 132, 133),
-]
+)
 
 DHW_SCHEDULE_NUMBERS: tuple[EconextNumberEntityDescription, ...] = tuple(
     EconextNumberEntityDescription(
@@ -1554,7 +1555,7 @@ CIRCUIT_SWITCHES: tuple[EconextSwitchEntityDescription, ...] = (
 
 # Circuit schedule entities - bitfield for 30-minute time slots
 # These are template descriptions - param_id is set dynamically per circuit
-_CIRCUIT_SCHEDULE_DAYS = [
+_CIRCUIT_SCHEDULE_DAYS = (
     ("sunday", "am", "pm"),
     ("monday", "am", "pm"),
     ("tuesday", "am", "pm"),
@@ -1562,11 +1563,11 @@ _CIRCUIT_SCHEDULE_DAYS = [
     ("thursday", "am", "pm"),
     ("friday", "am", "pm"),
     ("saturday", "am", "pm"),
-]
+)
 
 CIRCUIT_SCHEDULE_NUMBERS: tuple[EconextNumberEntityDescription, ...] = tuple(
     EconextNumberEntityDescription(
-        key=f"schedule_{day}_{period}",
+        key=sys.intern(f"schedule_{day}_{period}"),
         param_id="",  # Set dynamically per circuit
         device_type=DeviceType.CIRCUIT,
         icon="mdi:calendar-clock",
@@ -1584,7 +1585,7 @@ CIRCUIT_SCHEDULE_NUMBERS: tuple[EconextNumberEntityDescription, ...] = tuple(
 # These are template descriptions - param_id_am and param_id_pm are set dynamically per circuit
 CIRCUIT_SCHEDULE_DIAGNOSTIC_SENSORS: tuple[EconextSensorEntityDescription, ...] = tuple(
     EconextSensorEntityDescription(
-        key=f"schedule_{day}_decoded",
+        key=sys.intern(f"schedule_{day}_decoded"),
         param_id="",  # Set dynamically per circuit
         param_id_am="",  # Set dynamically per circuit
         param_id_pm="",  # Set dynamically per circuit
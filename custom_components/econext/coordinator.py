@@ -1,5 +1,6 @@
 """Data coordinator for ecoNEXT."""
 
+from collections.abc import Mapping
 from datetime import timedelta
 import logging
 from typing import Any
@@ -36,6 +37,7 @@ class EconextCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]]):
         self._thermostat_entity_id = thermostat_entity_id
         self.thermostat_status: dict[str, Any] | None = None
         self.thermostat_source_state: str = "ok"
+        self._active_circuits: tuple[Any, Mapping[int, Any], tuple[tuple[int, Any], ...]] | None = None
 
     async def _async_update_data(self) -> dict[str, dict[str, Any]]:
         """Fetch data from the API."""
@@ -61,12 +63,57 @@ class EconextCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]]):
 
         return params
 
+    @property
+    def params(self) -> dict[str, dict[str, Any]]:
+        """Get all parameters keyed by index (as string), empty if no data yet."""
+        return self.data or {}
+
+    @property
+    def dhw_available(self) -> bool:
+        """Return True if the DHW temperature sensor (TempCWU, 61) is present and connected (not 999.0)."""
+        param = self.params.get("61")
+        if param is None:
+            return False
+        value = param.get("value")
+        return value is not None and value != 999.0
+
     def get_param(self, param_id: str | int) -> dict[str, Any] | None:
         """Get a parameter by ID."""
         if self.data is None:
             return None
         return self.data.get(str(param_id))
 
+    def is_circuit_active(self, circuit: Any) -> bool:
+        """Return True if the circuit's active param is set (a missing or None value counts as inactive)."""
+        param = self.params.get(circuit.active_param)
+        if param is None:
+            return False
+        value = param.get("value")
+        return value is not None and value > 0
+
+    def get_active_circuits(self, circuits: Mapping[int, Any]) -> tuple[tuple[int, Any], ...]:
+        """Get (number, circuit) pairs whose active param is set.
+
+        Cached per data snapshot and circuits mapping so all platforms set up
+        from the same refresh share a single scan.
+        """
+        data = self.data
+        cached = self._active_circuits
+        if cached is None or cached[0] is not data or cached[1] is not circuits:
+            debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+            active: list[tuple[int, Any]] = []
+            for circuit_num, circuit in circuits.items():
+                if self.is_circuit_active(circuit):
+                    active.append((circuit_num, circuit))
+                elif debug_enabled:
+                    _LOGGER.debug(
+                        "Skipping Circuit %s - not active (param %s)",
+                        circuit_num,
+                        circuit.active_param,
+                    )
+            self._active_circuits = (data, circuits, tuple(active))
+        return self._active_circuits[2]
+
     def get_param_value(self, param_id: str | int) -> Any:
         """Get a parameter value by ID."""
         param = self.get_param(param_id)
@@ -166,6 +213,8 @@ class EconextCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]]):
         # On success, update local cache for instant UI feedback
         if result and self.data is not None and param_key in self.data:
             self.data[param_key]["value"] = value
+            # Data is mutated in place, so the snapshot identity check can't see this write
+            self._active_circuits = None
             self.async_set_updated_data(self.data)
 
         return result
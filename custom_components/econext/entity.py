@@ -118,12 +118,14 @@ class EconextEntity(CoordinatorEntity[EconextCoordinator]):
 
         Override in subclasses for specific validation (e.g., temp != 999.0).
         """
-        return self.coordinator.get_param(self._param_id) is not None
+        return self._param_id in self.coordinator.params
 
     def _get_param_value(self):
         """Get the current parameter value."""
-        return self.coordinator.get_param_value(self._param_id)
+        # _param_id is already a string key, so skip get_param's str() conversion
+        param = self.coordinator.params.get(self._param_id)
+        return None if param is None else param.get("value")
 
     def _get_param(self) -> dict | None:
         """Get the full parameter dict."""
-        return self.coordinator.get_param(self._param_id)
+        return self.coordinator.params.get(self._param_id)
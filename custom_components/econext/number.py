@@ -1,13 +1,16 @@
 """Number platform for ecoNEXT integration."""
 
+from dataclasses import replace
 import logging
+from operator import attrgetter
+import sys
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .climate import CIRCUITS
+from .climate import CIRCUIT_DEVICE_IDS, CIRCUITS
 from .const import (
     CIRCUIT_NUMBERS,
     CIRCUIT_SCHEDULE_NUMBERS,
@@ -25,6 +28,30 @@ from .entity import EconextEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Circuit attribute holding the parameter ID for each circuit number key
+_CIRCUIT_PARAM_GETTERS: dict[str, attrgetter] = {
+    "comfort_temp": attrgetter("comfort_param"),
+    "eco_temp": attrgetter("eco_param"),
+    "hysteresis": attrgetter("hysteresis_param"),
+    "max_temp_radiator": attrgetter("max_temp_radiator_param"),
+    "max_temp_heat": attrgetter("max_temp_heat_param"),
+    "fixed_temp": attrgetter("fixed_temp_param"),
+    "temp_reduction": attrgetter("temp_reduction_param"),
+    "curve_multiplier": attrgetter("curve_multiplier_param"),
+    "curve_shift": attrgetter("curve_shift_param"),
+    "room_temp_correction": attrgetter("room_temp_correction_param"),
+    "min_setpoint_cooling": attrgetter("min_setpoint_cooling_param"),
+    "max_setpoint_cooling": attrgetter("max_setpoint_cooling_param"),
+    "cooling_fixed_temp": attrgetter("cooling_fixed_temp_param"),
+}
+
+# Circuit schedule keys match the Circuit attribute names (e.g. schedule_sunday_am)
+_CIRCUIT_SCHEDULE_PARAM_GETTERS: dict[str, attrgetter] = {
+    sys.intern(f"schedule_{day}_{period}"): attrgetter(f"schedule_{day}_{period}")
+    for day in ("sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday")
+    for period in ("am", "pm")
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -33,15 +60,18 @@ async def async_setup_entry(
 ) -> None:
     """Set up ecoNEXT number entities from a config entry."""
     coordinator: EconextCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    # Single snapshot for all existence checks (param IDs are string keys)
+    params = coordinator.params
+    debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
 
     entities: list[EconextNumber] = []
 
     # Add controller number entities
     for description in CONTROLLER_NUMBERS:
         # Only add if parameter exists in data
-        if coordinator.get_param(description.param_id) is not None:
+        if description.param_id in params:
             entities.append(EconextNumber(coordinator, description))
-        else:
+        elif debug_enabled:
             _LOGGER.debug(
                 "Skipping number %s - parameter %s not found",
                 description.key,
@@ -49,38 +79,34 @@ async def async_setup_entry(
             )
 
     # Add DHW number entities if DHW device should be created
-    dhw_temp_param = coordinator.get_param("61")
-    if dhw_temp_param is not None:
-        dhw_temp_value = dhw_temp_param.get("value")
-        if dhw_temp_value is not None and dhw_temp_value != 999.0:
-            for description in DHW_NUMBERS:
-                if coordinator.get_param(description.param_id) is not None:
-                    entities.append(EconextNumber(coordinator, description))
-                else:
-                    _LOGGER.debug(
-                        "Skipping DHW number %s - parameter %s not found",
-                        description.key,
-                        description.param_id,
-                    )
-
-            # Add DHW schedule number entities
-            for description in DHW_SCHEDULE_NUMBERS:
-                if coordinator.get_param(description.param_id) is not None:
-                    entities.append(EconextNumber(coordinator, description))
-                else:
-                    _LOGGER.debug(
-                        "Skipping DHW schedule %s - parameter %s not found",
-                        description.key,
-                        description.param_id,
-                    )
+    if coordinator.dhw_available:
+        for description in DHW_NUMBERS:
+            if description.param_id in params:
+                entities.append(EconextNumber(coordinator, description))
+            elif debug_enabled:
+                _LOGGER.debug(
+                    "Skipping DHW number %s - parameter %s not found",
+                    description.key,
+                    description.param_id,
+                )
+
+        # Add DHW schedule number entities
+        for description in DHW_SCHEDULE_NUMBERS:
+            if description.param_id in params:
+                entities.append(EconextNumber(coordinator, description))
+            elif debug_enabled:
+                _LOGGER.debug(
+                    "Skipping DHW schedule %s - parameter %s not found",
+                    description.key,
+                    description.param_id,
+                )
 
     # Add heat pump number entities if heat pump device should be created
-    heatpump_param = coordinator.get_param("1133")
-    if heatpump_param is not None:
+    if "1133" in params:
         for description in HEATPUMP_NUMBERS:
-            if coordinator.get_param(description.param_id) is not None:
+            if description.param_id in params:
                 entities.append(EconextNumber(coordinator, description, device_id="heatpump"))
-            else:
+            elif debug_enabled:
                 _LOGGER.debug(
                     "Skipping heat pump number %s - parameter %s not found",
                     description.key,
@@ -89,9 +115,9 @@ async def async_setup_entry(
 
         # Add silent mode schedule number entities
         for description in SILENT_MODE_SCHEDULE_NUMBERS:
-            if coordinator.get_param(description.param_id) is not None:
+            if description.param_id in params:
                 entities.append(EconextNumber(coordinator, description, device_id="heatpump"))
-            else:
+            elif debug_enabled:
                 _LOGGER.debug(
                     "Skipping silent mode schedule %s - parameter %s not found",
                     description.key,
@@ -100,9 +126,9 @@ async def async_setup_entry(
 
         # Add heat pump schedule number entities
         for description in HEATPUMP_SCHEDULE_NUMBERS:
-            if coordinator.get_param(description.param_id) is not None:
+            if description.param_id in params:
                 entities.append(EconextNumber(coordinator, description, device_id="heatpump"))
-            else:
+            elif debug_enabled:
                 _LOGGER.debug(
                     "Skipping heat pump schedule %s - parameter %s not found",
                     description.key,
@@ -110,64 +136,40 @@ async def async_setup_entry(
                 )
 
     # Add circuit number entities if circuit is active
-    for circuit_num, circuit in CIRCUITS.items():
-        # Check if circuit is active
-        active = coordinator.get_param(circuit.active_param)
-        if active and active.get("value") > 0:
-            # Create number entities for this circuit
-            for description in CIRCUIT_NUMBERS:
-                # Map the number key to the appropriate circuit parameter
-                param_id = _get_circuit_param_id(circuit, description.key, coordinator)
-                if param_id and coordinator.get_param(param_id) is not None:
-                    # Create a copy of the description with the actual param_id
-                    circuit_desc = EconextNumberEntityDescription(
-                        key=description.key,
-                        param_id=param_id,
-                        device_type=description.device_type,
-                        native_unit_of_measurement=description.native_unit_of_measurement,
-                        entity_category=description.entity_category,
-                        icon=description.icon,
-                        native_min_value=description.native_min_value,
-                        native_max_value=description.native_max_value,
-                        native_step=description.native_step,
-                        min_value_param_id=description.min_value_param_id,
-                        max_value_param_id=description.max_value_param_id,
-                    )
-                    entities.append(EconextNumber(coordinator, circuit_desc, device_id=f"circuit_{circuit_num}"))
-                else:
-                    _LOGGER.debug(
-                        "Skipping Circuit %s number %s - parameter %s not found",
-                        circuit_num,
-                        description.key,
-                        param_id,
-                    )
-
-            # Add circuit schedule number entities
-            for description in CIRCUIT_SCHEDULE_NUMBERS:
-                # Map schedule key to the circuit schedule parameter
-                param_id = _get_circuit_schedule_param_id(circuit, description.key)
-                if param_id and coordinator.get_param(param_id) is not None:
-                    # Create a copy of the description with the actual param_id
-                    circuit_schedule_desc = EconextNumberEntityDescription(
-                        key=description.key,
-                        param_id=param_id,
-                        device_type=description.device_type,
-                        icon=description.icon,
-                        entity_category=description.entity_category,
-                        native_min_value=description.native_min_value,
-                        native_max_value=description.native_max_value,
-                        native_step=description.native_step,
-                    )
-                    entities.append(
-                        EconextNumber(coordinator, circuit_schedule_desc, device_id=f"circuit_{circuit_num}")
-                    )
-                else:
-                    _LOGGER.debug(
-                        "Skipping Circuit %s schedule %s - parameter %s not found",
-                        circuit_num,
-                        description.key,
-                        param_id,
-                    )
+    for circuit_num, circuit in coordinator.get_active_circuits(CIRCUITS):
+        device_id = CIRCUIT_DEVICE_IDS[circuit_num]
+
+        # Create number entities for this circuit
+        for description in CIRCUIT_NUMBERS:
+            # Map the number key to the appropriate circuit parameter
+            param_id = _get_circuit_param_id(circuit, description.key, coordinator)
+            if param_id and param_id in params:
+                # Create a copy of the description with the actual param_id
+                circuit_desc = replace(description, param_id=param_id)
+                entities.append(EconextNumber(coordinator, circuit_desc, device_id=device_id))
+            elif debug_enabled:
+                _LOGGER.debug(
+                    "Skipping Circuit %s number %s - parameter %s not found",
+                    circuit_num,
+                    description.key,
+                    param_id,
+                )
+
+        # Add circuit schedule number entities
+        for description in CIRCUIT_SCHEDULE_NUMBERS:
+            # Map schedule key to the circuit schedule parameter
+            param_id = _get_circuit_schedule_param_id(circuit, description.key)
+            if param_id and param_id in params:
+                # Create a copy of the description with the actual param_id
+                circuit_schedule_desc = replace(description, param_id=param_id)
+                entities.append(EconextNumber(coordinator, circuit_schedule_desc, device_id=device_id))
+            elif debug_enabled:
+                _LOGGER.debug(
+                    "Skipping Circuit %s schedule %s - parameter %s not found",
+                    circuit_num,
+                    description.key,
+                    param_id,
+                )
 
     async_add_entities(entities)
 
@@ -194,44 +196,14 @@ def _get_circuit_param_id(circuit, number_key: str, coordinator: EconextCoordina
         # Default to radiator if type unknown
         return circuit.curve_radiator_param
 
-    # Standard mappings
-    mapping = {
-        "comfort_temp": circuit.comfort_param,
-        "eco_temp": circuit.eco_param,
-        "hysteresis": circuit.hysteresis_param,
-        "max_temp_radiator": circuit.max_temp_radiator_param,
-        "max_temp_heat": circuit.max_temp_heat_param,
-        "fixed_temp": circuit.fixed_temp_param,
-        "temp_reduction": circuit.temp_reduction_param,
-        "curve_multiplier": circuit.curve_multiplier_param,
-        "curve_shift": circuit.curve_shift_param,
-        "room_temp_correction": circuit.room_temp_correction_param,
-        "min_setpoint_cooling": circuit.min_setpoint_cooling_param,
-        "max_setpoint_cooling": circuit.max_setpoint_cooling_param,
-        "cooling_fixed_temp": circuit.cooling_fixed_temp_param,
-    }
-    return mapping.get(number_key)
+    getter = _CIRCUIT_PARAM_GETTERS.get(number_key)
+    return getter(circuit) if getter else None
 
 
 def _get_circuit_schedule_param_id(circuit, schedule_key: str) -> str | None:
     """Get the parameter ID for a circuit schedule entity based on its key."""
-    mapping = {
-        "schedule_sunday_am": circuit.schedule_sunday_am,
-        "schedule_sunday_pm": circuit.schedule_sunday_pm,
-        "schedule_monday_am": circuit.schedule_monday_am,
-        "schedule_monday_pm": circuit.schedule_monday_pm,
-        "schedule_tuesday_am": circuit.schedule_tuesday_am,
-        "schedule_tuesday_pm": circuit.schedule_tuesday_pm,
-        "schedule_wednesday_am": circuit.schedule_wednesday_am,
-        "schedule_wednesday_pm": circuit.schedule_wednesday_pm,
-        "schedule_thursday_am": circuit.schedule_thursday_am,
-        "schedule_thursday_pm": circuit.schedule_thursday_pm,
-        "schedule_friday_am": circuit.schedule_friday_am,
-        "schedule_friday_pm": circuit.schedule_friday_pm,
-        "schedule_saturday_am": circuit.schedule_saturday_am,
-        "schedule_saturday_pm": circuit.schedule_saturday_pm,
-    }
-    return mapping.get(schedule_key)
+    getter = _CIRCUIT_SCHEDULE_PARAM_GETTERS.get(schedule_key)
+    return getter(circuit) if getter else None
 
 
 class EconextNumber(EconextEntity, NumberEntity):
@@ -269,6 +241,17 @@ class EconextNumber(EconextEntity, NumberEntity):
         else:
             self._attr_mode = NumberMode.SLIDER
 
+        # Limit metadata from allParams is static, so resolve it once here
+        param = coordinator.get_param(description.param_id) or {}
+        self._min_value_dp = param.get("minvDP")
+        self._max_value_dp = param.get("maxvDP")
+        minv = param.get("minv")
+        maxv = param.get("maxv")
+        # Only use API values if they form a valid range (min < max)
+        self._static_range: tuple[float, float] | None = None
+        if minv is not None and maxv is not None and float(minv) < float(maxv):
+            self._static_range = (float(minv), float(maxv))
+
     @property
     def native_value(self) -> float | None:
         """Return the current value."""
@@ -286,21 +269,14 @@ class EconextNumber(EconextEntity, NumberEntity):
         2. Static minv from allParams (if valid range with maxv)
         3. Fallback from description
         """
-        param = self.coordinator.get_param(self._description.param_id)
-        if param:
-            # Check for dynamic min (minvDP points to another parameter)
-            minv_dp = param.get("minvDP")
-            if minv_dp is not None:
-                dynamic_min = self.coordinator.get_param_value(minv_dp)
-                if dynamic_min is not None:
-                    return float(dynamic_min)
-
-            # Check for static min/max in the parameter data
-            minv = param.get("minv")
-            maxv = param.get("maxv")
-            # Only use API values if they form a valid range (min < max)
-            if minv is not None and maxv is not None and float(minv) < float(maxv):
-                return float(minv)
+        # Check for dynamic min (minvDP points to another parameter)
+        if self._min_value_dp is not None:
+            dynamic_min = self.coordinator.get_param_value(self._min_value_dp)
+            if dynamic_min is not None:
+                return float(dynamic_min)
+
+        if self._static_range is not None:
+            return self._static_range[0]
 
         # Fallback to description value
         return self._description.native_min_value or 0
@@ -314,21 +290,14 @@ class EconextNumber(EconextEntity, NumberEntity):
         2. Static maxv from allParams (if valid range with minv)
         3. Fallback from description
         """
-        param = self.coordinator.get_param(self._description.param_id)
-        if param:
-            # Check for dynamic max (maxvDP points to another parameter)
-            maxv_dp = param.get("maxvDP")
-            if maxv_dp is not None:
-                dynamic_max = self.coordinator.get_param_value(maxv_dp)
-                if dynamic_max is not None:
-                    return float(dynamic_max)
-
-            # Check for static min/max in the parameter data
-            minv = param.get("minv")
-            maxv = param.get("maxv")
-            # Only use API values if they form a valid range (min < max)
-            if minv is not None and maxv is not None and float(minv) < float(maxv):
-                return float(maxv)
+        # Check for dynamic max (maxvDP points to another parameter)
+        if self._max_value_dp is not None:
+            dynamic_max = self.coordinator.get_param_value(self._max_value_dp)
+            if dynamic_max is not None:
+                return float(dynamic_max)
+
+        if self._static_range is not None:
+            return self._static_range[1]
 
         # Fallback to description value
         return self._description.native_max_value or 100
@@ -339,32 +308,33 @@ class EconextNumber(EconextEntity, NumberEntity):
         if value == self.native_value:
             return
 
-        # Validate against min/max bounds
+        # Validate against min/max bounds - a value below min is rejected
+        # outright, so check it before resolving the max
         min_value = self.native_min_value
-        max_value = self.native_max_value
-
-        if value > max_value:
+        if value < min_value:
             _LOGGER.warning(
-                "Requested value '%s' for %s exceeds maximum allowed value '%s'",
+                "Requested value '%s' for %s is below minimum allowed value '%s'",
                 value,
                 self._description.key,
-                max_value,
+                min_value,
             )
-            # Don't return - HA might allow slightly over max due to rounding
+            return
 
-        if value < min_value:
+        max_value = self.native_max_value
+        if value > max_value:
             _LOGGER.warning(
-                "Requested value '%s' for %s is below minimum allowed value '%s'",
+                "Requested value '%s' for %s exceeds maximum allowed value '%s'",
                 value,
                 self._description.key,
-                min_value,
+                max_value,
             )
-            return
+            # Don't return - HA might allow slightly over max due to rounding
 
         # Convert to int if the value has no fractional part
         # This ensures parameters that only accept integers receive integers,
         # while fractional values (like 0.3 for heat curves) stay as floats
-        api_value = int(value) if value == int(value) else value
+        int_value = int(value)
+        api_value = int_value if value == int_value else value
 
         _LOGGER.debug(
             "Setting %s (param %s) to %s",
@@ -1,13 +1,15 @@
 """Select platform for ecoNEXT integration."""
 
+from dataclasses import replace
 import logging
+from operator import attrgetter
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .climate import CIRCUITS
+from .climate import CIRCUIT_DEVICE_IDS, CIRCUITS
 from .const import (
     CIRCUIT_SELECTS,
     CONTROLLER_SELECTS,
@@ -21,6 +23,11 @@ from .entity import EconextEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Circuit attribute holding the parameter ID for each circuit select key
+_CIRCUIT_PARAM_GETTERS: dict[str, attrgetter] = {
+    "circuit_type": attrgetter("type_settings_param"),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -29,15 +36,18 @@ async def async_setup_entry(
 ) -> None:
     """Set up ecoNEXT select entities from a config entry."""
     coordinator: EconextCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    # Single snapshot for all existence checks (param IDs are string keys)
+    params = coordinator.params
+    debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
 
     entities: list[EconextSelect] = []
 
     # Add controller select entities
     for description in CONTROLLER_SELECTS:
         # Only add if parameter exists in data
-        if coordinator.get_param(description.param_id) is not None:
+        if description.param_id in params:
             entities.append(EconextSelect(coordinator, description))
-        else:
+        elif debug_enabled:
             _LOGGER.debug(
                 "Skipping select %s - parameter %s not found",
                 description.key,
@@ -45,28 +55,24 @@ async def async_setup_entry(
             )
 
     # Add DHW select entities if DHW device should be created
-    dhw_temp_param = coordinator.get_param("61")
-    if dhw_temp_param is not None:
-        dhw_temp_value = dhw_temp_param.get("value")
-        if dhw_temp_value is not None and dhw_temp_value != 999.0:
-            for description in DHW_SELECTS:
-                if coordinator.get_param(description.param_id) is not None:
-                    entities.append(EconextSelect(coordinator, description))
-                else:
-                    _LOGGER.debug(
-                        "Skipping DHW select %s - parameter %s not found",
-                        description.key,
-                        description.param_id,
-                    )
+    if coordinator.dhw_available:
+        for description in DHW_SELECTS:
+            if description.param_id in params:
+                entities.append(EconextSelect(coordinator, description))
+            elif debug_enabled:
+                _LOGGER.debug(
+                    "Skipping DHW select %s - parameter %s not found",
+                    description.key,
+                    description.param_id,
+                )
 
     # Add heat pump select entities if heat pump device should be created
     # Check if AxenWorkState parameter exists to determine if heat pump is present
-    heatpump_param = coordinator.get_param("1133")
-    if heatpump_param is not None:
+    if "1133" in params:
         for description in HEATPUMP_SELECTS:
-            if coordinator.get_param(description.param_id) is not None:
+            if description.param_id in params:
                 entities.append(EconextSelect(coordinator, description))
-            else:
+            elif debug_enabled:
                 _LOGGER.debug(
                     "Skipping heat pump select %s - parameter %s not found",
                     description.key,
@@ -74,44 +80,32 @@ async def async_setup_entry(
                 )
 
     # Add circuit select entities if circuit is active
-    for circuit_num, circuit in CIRCUITS.items():
-        # Check if circuit is active
-        active = coordinator.get_param(circuit.active_param)
-        if active and active.get("value") > 0:
-            # Create select entities for this circuit
-            for description in CIRCUIT_SELECTS:
-                # Map the select key to the appropriate circuit parameter
-                param_id = _get_circuit_param_id(circuit, description.key)
-                if param_id and coordinator.get_param(param_id) is not None:
-                    # Create a copy of the description with the actual param_id
-                    circuit_desc = EconextSelectEntityDescription(
-                        key=description.key,
-                        param_id=param_id,
-                        device_type=description.device_type,
-                        entity_category=description.entity_category,
-                        icon=description.icon,
-                        options=description.options,
-                        value_map=description.value_map,
-                        reverse_map=description.reverse_map,
-                    )
-                    entities.append(EconextSelect(coordinator, circuit_desc, device_id=f"circuit_{circuit_num}"))
-                else:
-                    _LOGGER.debug(
-                        "Skipping Circuit %s select %s - parameter %s not found",
-                        circuit_num,
-                        description.key,
-                        param_id,
-                    )
+    for circuit_num, circuit in coordinator.get_active_circuits(CIRCUITS):
+        device_id = CIRCUIT_DEVICE_IDS[circuit_num]
+
+        # Create select entities for this circuit
+        for description in CIRCUIT_SELECTS:
+            # Map the select key to the appropriate circuit parameter
+            param_id = _get_circuit_param_id(circuit, description.key)
+            if param_id and param_id in params:
+                # Create a copy of the description with the actual param_id
+                circuit_desc = replace(description, param_id=param_id)
+                entities.append(EconextSelect(coordinator, circuit_desc, device_id=device_id))
+            elif debug_enabled:
+                _LOGGER.debug(
+                    "Skipping Circuit %s select %s - parameter %s not found",
+                    circuit_num,
+                    description.key,
+                    param_id,
+                )
 
     async_add_entities(entities)
 
 
 def _get_circuit_param_id(circuit, select_key: str) -> str | None:
     """Get the parameter ID for a circuit select entity based on its key."""
-    mapping = {
-        "circuit_type": circuit.type_settings_param,
-    }
-    return mapping.get(select_key)
+    getter = _CIRCUIT_PARAM_GETTERS.get(select_key)
+    return getter(circuit) if getter else None
 
 
 class EconextSelect(EconextEntity, SelectEntity):
@@ -133,6 +127,8 @@ class EconextSelect(EconextEntity, SelectEntity):
         self._description = description
         self._attr_translation_key = description.key
         self._attr_options = description.options
+        self._value_map = description.value_map
+        self._reverse_map = description.reverse_map
 
         # Apply description attributes
         if description.entity_category:
@@ -148,12 +144,12 @@ class EconextSelect(EconextEntity, SelectEntity):
             return None
 
         # Map the raw value to an option string
-        return self._description.value_map.get(int(value))
+        return self._value_map.get(int(value))
 
     async def async_select_option(self, option: str) -> None:
         """Set the selected option."""
         # Map the option string to raw value
-        raw_value = self._description.reverse_map.get(option)
+        raw_value = self._reverse_map.get(option)
         if raw_value is None:
             _LOGGER.error("Unknown option %s for %s", option, self._description.key)
             return
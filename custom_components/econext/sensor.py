@@ -1,6 +1,10 @@
 """Sensor platform for ecoNEXT integration."""
 
+from dataclasses import replace
+from functools import lru_cache
 import logging
+from operator import attrgetter
+import sys
 from typing import Any
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
@@ -9,7 +13,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .climate import CIRCUITS
+from .climate import CIRCUIT_DEVICE_IDS, CIRCUITS
 from .const import (
     CIRCUIT_SCHEDULE_DIAGNOSTIC_SENSORS,
     CIRCUIT_SENSORS,
@@ -29,11 +33,41 @@ from .entity import EconextEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Circuit attribute holding the parameter ID for each circuit sensor key
+_CIRCUIT_PARAM_GETTERS: dict[str, attrgetter] = {
+    "thermostat_temp": attrgetter("thermostat_param"),
+    "calc_temp": attrgetter("calc_temp_param"),
+    "room_temp_setpoint": attrgetter("room_temp_setpoint_param"),
+    "active_preset_mode": attrgetter("eco_param"),  # Uses eco as primary param for unique ID
+    "boost_time_remaining": attrgetter("boost_time_left_param"),
+}
 
+# Circuit (AM, PM) attributes for each circuit schedule diagnostic sensor key
+_CIRCUIT_SCHEDULE_DIAGNOSTIC_GETTERS: dict[str, attrgetter] = {
+    sys.intern(f"schedule_{day}_decoded"): attrgetter(f"schedule_{day}_am", f"schedule_{day}_pm")
+    for day in ("sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday")
+}
+
+
+def _slot_label(half_hours: int) -> str:
+    """Format a half-hour slot offset from midnight as HH:MM."""
+    return f"{half_hours // 2:02d}:{(half_hours % 2) * 30:02d}"
+
+
+_SLOT_MASK = 0xFFFFFF  # 24 half-hour slots per bitfield
+
+# Slot boundary labels (0..24 inclusive) for each half of the day
+_SLOT_LABELS_AM: tuple[str, ...] = tuple(_slot_label(slot) for slot in range(25))
+_SLOT_LABELS_PM: tuple[str, ...] = tuple(_slot_label(24 + slot) for slot in range(25))
+
+
+@lru_cache(maxsize=4096)
 def decode_schedule_bitfield(value: int, is_am: bool = True) -> str:
     """
     Decode a schedule bitfield into human-readable time ranges.
 
+    Results are cached since schedule bitfields rarely change between polls.
+
     Args:
         value: uint32 bitfield where each bit = 30-minute slot
         is_am: True for AM schedule (00:00-11:30), False for PM (12:00-23:30)
@@ -44,31 +78,27 @@ def decode_schedule_bitfield(value: int, is_am: bool = True) -> str:
     if value == 0:
         return "No active periods"
 
+    labels = _SLOT_LABELS_AM if is_am else _SLOT_LABELS_PM
     ranges = []
-    start_bit = None
-    start_offset = 0 if is_am else 24  # PM schedules start at 12:00 (24 half-hours)
-
-    for bit in range(24):  # 24 half-hour slots
-        is_set = (value >> bit) & 1
-
-        if is_set and start_bit is None:
-            start_bit = bit
-        elif not is_set and start_bit is not None:
-            # End of range
-            start_hour = (start_offset + start_bit) // 2
-            start_min = ((start_offset + start_bit) % 2) * 30
-            end_hour = (start_offset + bit) // 2
-            end_min = ((start_offset + bit) % 2) * 30
-            ranges.append(f"{start_hour:02d}:{start_min:02d}-{end_hour:02d}:{end_min:02d}")
-            start_bit = None
-
-    # Handle range extending to end
-    if start_bit is not None:
-        start_hour = (start_offset + start_bit) // 2
-        start_min = ((start_offset + start_bit) % 2) * 30
-        end_hour = (start_offset + 24) // 2
-        end_min = 0
-        ranges.append(f"{start_hour:02d}:{start_min:02d}-{end_hour:02d}:{end_min:02d}")
+
+    # Only the 24 half-hour slots are meaningful
+    slots = value & _SLOT_MASK
+    # A run starts at a set bit whose lower neighbour is clear,
+    # and ends at a set bit whose upper neighbour is clear
+    starts = slots & ~(slots << 1)
+    ends = slots & ~(slots >> 1)
+
+    # Fast path: a single contiguous run (the common case) needs no pairing loop
+    if starts and not starts & (starts - 1):
+        return f"{labels[starts.bit_length() - 1]}-{labels[slots.bit_length()]}"
+
+    # Runs are ordered, so the n-th start pairs with the n-th end
+    while starts:
+        start_bit = (starts & -starts).bit_length() - 1
+        end_bit = (ends & -ends).bit_length()  # Exclusive
+        ranges.append(f"{labels[start_bit]}-{labels[end_bit]}")
+        starts &= starts - 1
+        ends &= ends - 1
 
     return ", ".join(ranges)
 
@@ -80,15 +110,18 @@ async def async_setup_entry(
 ) -> None:
     """Set up ecoNEXT sensors from a config entry."""
     coordinator: EconextCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    # Single snapshot for all existence checks (param IDs are string keys)
+    params = coordinator.params
+    debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
 
     entities: list[SensorEntity] = []
 
     # Add controller sensors
     for description in CONTROLLER_SENSORS:
         # Only add if parameter exists in data
-        if coordinator.get_param(description.param_id) is not None:
+        if description.param_id in params:
             entities.append(EconextSensor(coordinator, description))
-        else:
+        elif debug_enabled:
             _LOGGER.debug(
                 "Skipping sensor %s - parameter %s not found",
                 description.key,
@@ -96,45 +129,40 @@ async def async_setup_entry(
             )
 
     # Add DHW sensors if DHW device should be created
-    # DHW device is created if TempCWU (61) exists and is valid (not 999.0)
-    dhw_temp_param = coordinator.get_param("61")
-    if dhw_temp_param is not None:
-        dhw_temp_value = dhw_temp_param.get("value")
-        if dhw_temp_value is not None and dhw_temp_value != 999.0:
-            for description in DHW_SENSORS:
-                if coordinator.get_param(description.param_id) is not None:
-                    entities.append(EconextSensor(coordinator, description))
-                else:
-                    _LOGGER.debug(
-                        "Skipping DHW sensor %s - parameter %s not found",
-                        description.key,
-                        description.param_id,
-                    )
-
-            # Add DHW schedule diagnostic sensors
-            for description in DHW_SCHEDULE_DIAGNOSTIC_SENSORS:
-                # Check that both AM and PM params exist
-                if (
-                    coordinator.get_param(description.param_id_am) is not None
-                    and coordinator.get_param(description.param_id_pm) is not None
-                ):
-                    entities.append(EconextScheduleDiagnosticSensor(coordinator, description))
-                else:
-                    _LOGGER.debug(
-                        "Skipping DHW schedule diagnostic sensor %s - parameters %s/%s not found",
-                        description.key,
-                        description.param_id_am,
-                        description.param_id_pm,
-                    )
+    if coordinator.dhw_available:
+        for description in DHW_SENSORS:
+            if description.param_id in params:
+                entities.append(EconextSensor(coordinator, description))
+            elif debug_enabled:
+                _LOGGER.debug(
+                    "Skipping DHW sensor %s - parameter %s not found",
+                    description.key,
+                    description.param_id,
+                )
+
+        # Add DHW schedule diagnostic sensors
+        for description in DHW_SCHEDULE_DIAGNOSTIC_SENSORS:
+            # Check that both AM and PM params exist
+            if (
+                description.param_id_am in params
+                and description.param_id_pm in params
+            ):
+                entities.append(EconextScheduleDiagnosticSensor(coordinator, description))
+            elif debug_enabled:
+                _LOGGER.debug(
+                    "Skipping DHW schedule diagnostic sensor %s - parameters %s/%s not found",
+                    description.key,
+                    description.param_id_am,
+                    description.param_id_pm,
+                )
 
     # Add heat pump sensors if heat pump device should be created
     # Check if AxenWorkState parameter exists to determine if heat pump is present
-    heatpump_param = coordinator.get_param("1133")
-    if heatpump_param is not None:
+    if "1133" in params:
         for description in HEATPUMP_SENSORS:
-            if coordinator.get_param(description.param_id) is not None:
+            if description.param_id in params:
                 entities.append(EconextSensor(coordinator, description, device_id="heatpump"))
-            else:
+            elif debug_enabled:
                 _LOGGER.debug(
                     "Skipping heat pump sensor %s - parameter %s not found",
                     description.key,
@@ -145,11 +173,11 @@ async def async_setup_entry(
         for description in SILENT_MODE_SCHEDULE_DIAGNOSTIC_SENSORS:
             # Check that both AM and PM params exist
             if (
-                coordinator.get_param(description.param_id_am) is not None
-                and coordinator.get_param(description.param_id_pm) is not None
+                description.param_id_am in params
+                and description.param_id_pm in params
             ):
                 entities.append(EconextScheduleDiagnosticSensor(coordinator, description, device_id="heatpump"))
-            else:
+            elif debug_enabled:
                 _LOGGER.debug(
                     "Skipping silent mode schedule diagnostic sensor %s - parameters %s/%s not found",
                     description.key,
@@ -161,11 +189,11 @@ async def async_setup_entry(
         for description in HEATPUMP_SCHEDULE_DIAGNOSTIC_SENSORS:
             # Check that both AM and PM params exist
             if (
-                coordinator.get_param(description.param_id_am) is not None
-                and coordinator.get_param(description.param_id_pm) is not None
+                description.param_id_am in params
+                and description.param_id_pm in params
             ):
                 entities.append(EconextScheduleDiagnosticSensor(coordinator, description, device_id="heatpump"))
-            else:
+            elif debug_enabled:
                 _LOGGER.debug(
                     "Skipping heat pump schedule diagnostic sensor %s - parameters %s/%s not found",
                     description.key,
@@ -174,128 +202,101 @@ async def async_setup_entry(
                 )
 
     # Add circuit sensors if circuit is active
-    for circuit_num, circuit in CIRCUITS.items():
-        # Check if circuit is active
-        active = coordinator.get_param(circuit.active_param)
-        if active and active.get("value") > 0:
-            # Create sensors for this circuit
-            for description in CIRCUIT_SENSORS:
-                # Map the sensor key to the appropriate circuit parameter
-                param_id = _get_circuit_param_id(circuit, description.key)
-                if param_id and coordinator.get_param(param_id) is not None:
-                    # Create a copy of the description with the actual param_id and device_id
-                    circuit_desc = EconextSensorEntityDescription(
-                        key=description.key,
-                        param_id=param_id,
-                        device_type=description.device_type,
-                        device_class=description.device_class,
-                        state_class=description.state_class,
-                        native_unit_of_measurement=description.native_unit_of_measurement,
-                        entity_category=description.entity_category,
-                        icon=description.icon,
-                        precision=description.precision,
-                        options=description.options,
-                        value_map=description.value_map,
-                    )
-
-                    # Use special sensor class for active_preset_mode
-                    if description.key == "active_preset_mode":
-                        # Also check that eco, comfort and setpoint params exist
-                        if (
-                            coordinator.get_param(circuit.eco_param) is not None
-                            and coordinator.get_param(circuit.comfort_param) is not None
-                            and coordinator.get_param(circuit.room_temp_setpoint_param) is not None
-                        ):
-                            entities.append(
-                                EconextActiveScheduleModeSensor(
-                                    coordinator,
-                                    circuit_desc,
-                                    circuit.eco_param,
-                                    circuit.comfort_param,
-                                    circuit.room_temp_setpoint_param,
-                                    device_id=f"circuit_{circuit_num}",
-                                )
+    for circuit_num, circuit in coordinator.get_active_circuits(CIRCUITS):
+        device_id = CIRCUIT_DEVICE_IDS[circuit_num]
+
+        # Create sensors for this circuit
+        for description in CIRCUIT_SENSORS:
+            # Map the sensor key to the appropriate circuit parameter
+            param_id = _get_circuit_param_id(circuit, description.key)
+            if param_id and param_id in params:
+                # Create a copy of the description with the actual param_id (device_id is passed to the entity)
+                circuit_desc = replace(description, param_id=param_id)
+
+                # Use special sensor class for active_preset_mode
+                if description.key == "active_preset_mode":
+                    # Also check that eco, comfort and setpoint params exist
+                    if (
+                        circuit.eco_param in params
+                        and circuit.comfort_param in params
+                        and circuit.room_temp_setpoint_param in params
+                    ):
+                        entities.append(
+                            EconextActiveScheduleModeSensor(
+                                coordinator,
+                                circuit_desc,
+                                circuit.eco_param,
+                                circuit.comfort_param,
+                                circuit.room_temp_setpoint_param,
+                                device_id=device_id,
                             )
-                    else:
-                        entities.append(EconextSensor(coordinator, circuit_desc, device_id=f"circuit_{circuit_num}"))
-                else:
-                    _LOGGER.debug(
-                        "Skipping Circuit %s sensor %s - parameter %s not found",
-                        circuit_num,
-                        description.key,
-                        param_id,
-                    )
-
-            # Add circuit schedule diagnostic sensors
-            for description in CIRCUIT_SCHEDULE_DIAGNOSTIC_SENSORS:
-                # Get AM and PM param IDs from circuit
-                param_id_am, param_id_pm = _get_circuit_schedule_diagnostic_params(circuit, description.key)
-                if (
-                    param_id_am
-                    and param_id_pm
-                    and coordinator.get_param(param_id_am) is not None
-                    and coordinator.get_param(param_id_pm) is not None
-                ):
-                    # Create a copy of the description with the actual param IDs
-                    circuit_schedule_desc = EconextSensorEntityDescription(
-                        key=description.key,
-                        param_id=param_id_am,  # Use AM as primary
-                        param_id_am=param_id_am,
-                        param_id_pm=param_id_pm,
-                        device_type=description.device_type,
-                        icon=description.icon,
-                        entity_category=description.entity_category,
-                    )
-                    entities.append(
-                        EconextScheduleDiagnosticSensor(
-                            coordinator, circuit_schedule_desc, device_id=f"circuit_{circuit_num}"
                         )
-                    )
                 else:
-                    _LOGGER.debug(
-                        "Skipping Circuit %s schedule diagnostic sensor %s - parameters %s/%s not found",
-                        circuit_num,
-                        description.key,
-                        param_id_am,
-                        param_id_pm,
-                    )
+                    entities.append(EconextSensor(coordinator, circuit_desc, device_id=device_id))
+            elif debug_enabled:
+                _LOGGER.debug(
+                    "Skipping Circuit %s sensor %s - parameter %s not found",
+                    circuit_num,
+                    description.key,
+                    param_id,
+                )
+
+        # Add circuit schedule diagnostic sensors
+        for description in CIRCUIT_SCHEDULE_DIAGNOSTIC_SENSORS:
+            # Get AM and PM param IDs from circuit
+            param_id_am, param_id_pm = _get_circuit_schedule_diagnostic_params(circuit, description.key)
+            if (
+                param_id_am
+                and param_id_pm
+                and param_id_am in params
+                and param_id_pm in params
+            ):
+                # Create a copy of the description with the actual param IDs
+                circuit_schedule_desc = replace(
+                    description,
+                    param_id=param_id_am,  # Use AM as primary
+                    param_id_am=param_id_am,
+                    param_id_pm=param_id_pm,
+                )
+                entities.append(
+                    EconextScheduleDiagnosticSensor(coordinator, circuit_schedule_desc, device_id=device_id)
+                )
+            elif debug_enabled:
+                _LOGGER.debug(
+                    "Skipping Circuit %s schedule diagnostic sensor %s - parameters %s/%s not found",
+                    circuit_num,
+                    description.key,
+                    param_id_am,
+                    param_id_pm,
+                )
 
     # Add alarm history sensor
     entities.append(EconextAlarmSensor(coordinator))
 
     # Virtual thermostat sensors (only if thermostat entity is configured)
-    if entry.options.get(CONF_THERMOSTAT_ENTITY):
-        entities.append(ThermostatTemperatureSensor(coordinator))
-        entities.append(ThermostatStateSensor(coordinator))
-        entities.append(ThermostatSourceSensor(coordinator, entry.options[CONF_THERMOSTAT_ENTITY]))
+    thermostat_entity = entry.options.get(CONF_THERMOSTAT_ENTITY)
+    if thermostat_entity:
+        entities.extend(
+            (
+                ThermostatTemperatureSensor(coordinator),
+                ThermostatStateSensor(coordinator),
+                ThermostatSourceSensor(coordinator, thermostat_entity),
+            )
+        )
 
-    async_add_entities(entities)
+    async_add_entities(entities, update_before_add=False)
 
 
 def _get_circuit_param_id(circuit, sensor_key: str) -> str | None:
     """Get the parameter ID for a circuit sensor based on its key."""
-    mapping = {
-        "thermostat_temp": circuit.thermostat_param,
-        "calc_temp": circuit.calc_temp_param,
-        "room_temp_setpoint": circuit.room_temp_setpoint_param,
-        "active_preset_mode": circuit.eco_param,  # Uses eco as primary param for unique ID
-        "boost_time_remaining": circuit.boost_time_left_param,
-    }
-    return mapping.get(sensor_key)
+    getter = _CIRCUIT_PARAM_GETTERS.get(sensor_key)
+    return getter(circuit) if getter else None
 
 
 def _get_circuit_schedule_diagnostic_params(circuit, sensor_key: str) -> tuple[str | None, str | None]:
     """Get the AM and PM parameter IDs for a circuit schedule diagnostic sensor based on its key."""
-    mapping = {
-        "schedule_sunday_decoded": (circuit.schedule_sunday_am, circuit.schedule_sunday_pm),
-        "schedule_monday_decoded": (circuit.schedule_monday_am, circuit.schedule_monday_pm),
-        "schedule_tuesday_decoded": (circuit.schedule_tuesday_am, circuit.schedule_tuesday_pm),
-        "schedule_wednesday_decoded": (circuit.schedule_wednesday_am, circuit.schedule_wednesday_pm),
-        "schedule_thursday_decoded": (circuit.schedule_thursday_am, circuit.schedule_thursday_pm),
-        "schedule_friday_decoded": (circuit.schedule_friday_am, circuit.schedule_friday_pm),
-        "schedule_saturday_decoded": (circuit.schedule_saturday_am, circuit.schedule_saturday_pm),
-    }
-    return mapping.get(sensor_key, (None, None))
+    getter = _CIRCUIT_SCHEDULE_DIAGNOSTIC_GETTERS.get(sensor_key)
+    return getter(circuit) if getter else (None, None)
 
 
 class EconextSensor(EconextEntity, SensorEntity):
@@ -331,6 +332,17 @@ class EconextSensor(EconextEntity, SensorEntity):
         if description.options:
             self._attr_options = [*description.options, "unknown"]
 
+        # Pick the value conversion once - the description never changes
+        if description.value_map is not None:
+            self._convert_value = self._convert_mapped_value
+        elif description.value_fn is not None:
+            self._convert_value = self._convert_numeric_value
+        elif description.precision is not None:
+            self._precision = description.precision
+            self._convert_value = self._convert_rounded_value
+        else:
+            self._convert_value = self._convert_raw_value
+
     @property
     def native_value(self):
         """Return the state of the sensor."""
@@ -339,24 +351,45 @@ class EconextSensor(EconextEntity, SensorEntity):
         if value is None:
             return None
 
-        # Apply value mapping for enum sensors
-        if self._description.value_map is not None:
-            mapped = self._description.value_map.get(int(value))
-            if mapped is None:
-                _LOGGER.warning(
-                    "Unmapped value %s for sensor %s", int(value), self._description.key
-                )
-                return "unknown"
-            return mapped
+        return self._convert_value(value)
 
+    def _convert_mapped_value(self, value):
+        """Apply value mapping for enum sensors."""
+        try:
+            key = int(value)
+        except (TypeError, ValueError):
+            # Non-numeric raw value can't be in the map - report it as unmapped
+            key = value
+        mapped = self._description.value_map.get(key)
+        if mapped is None:
+            _LOGGER.warning("Unmapped value %s for sensor %s", key, self._description.key)
+            return "unknown"
+        return mapped
+
+    def _convert_numeric_value(self, value):
+        """Apply value transformation and precision to numeric values."""
         # Apply value transformation if specified
         if self._description.value_fn is not None and isinstance(value, (int, float)):
             value = self._description.value_fn(value)
 
-        # Apply precision if specified
-        if self._description.precision is not None and isinstance(value, (int, float)):
-            return round(value, self._description.precision)
+        # Apply precision if specified (non-numeric values pass through)
+        if self._description.precision is not None:
+            try:
+                return round(value, self._description.precision)
+            except TypeError:
+                return value
+
+        return value
+
+    def _convert_rounded_value(self, value):
+        """Round numeric values to the description precision (most common conversion)."""
+        try:
+            return round(value, self._precision)
+        except TypeError:
+            return value
 
+    def _convert_raw_value(self, value):
+        """Return the value unchanged."""
         return value
 
     def _is_value_valid(self) -> bool:
@@ -506,6 +539,10 @@ class EconextAlarmSensor(EconextEntity, SensorEntity):
         uid = coordinator.get_device_uid()
         self._attr_unique_id = f"{uid}_last_alarm"
 
+        # Alarm history is only rebuilt when the underlying alarms change
+        self._alarm_history_source: list[dict[str, Any]] | None = None
+        self._alarm_history: list[dict[str, Any]] = []
+
     @property
     def native_value(self) -> str | None:
         """Return description of the most recent alarm."""
@@ -531,18 +568,25 @@ class EconextAlarmSensor(EconextEntity, SensorEntity):
             attrs["to_date"] = latest.get("to_date")
 
         # Include recent alarm history (last 10)
-        attrs["alarm_history"] = [
-            {
-                "code": a.get("code"),
-                "name": get_alarm_name(a.get("code", 0)),
-                "from_date": a.get("from_date"),
-                "to_date": a.get("to_date"),
-            }
-            for a in alarms[:10]
-        ]
+        attrs["alarm_history"] = self._get_alarm_history(alarms[:10])
 
         return attrs
 
+    def _get_alarm_history(self, recent: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Return the formatted alarm history, reusing it if the alarms are unchanged."""
+        if recent != self._alarm_history_source:
+            self._alarm_history_source = recent
+            self._alarm_history = [
+                {
+                    "code": a.get("code"),
+                    "name": get_alarm_name(a.get("code", 0)),
+                    "from_date": a.get("from_date"),
+                    "to_date": a.get("to_date"),
+                }
+                for a in recent
+            ]
+        return self._alarm_history
+
     def _is_value_valid(self) -> bool:
         """Alarm data is always valid if coordinator is updating."""
         return True
@@ -1,5 +1,6 @@
 """Switch platform for ecoNEXT integration."""
 
+from dataclasses import replace
 import logging
 
 from homeassistant.components.switch import SwitchEntity
@@ -7,7 +8,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .climate import CIRCUITS
+from .climate import CIRCUIT_DEVICE_IDS, CIRCUITS
 from .const import (
     CIRCUIT_SWITCHES,
     CONF_THERMOSTAT_ENTITY,
@@ -30,6 +31,7 @@ async def async_setup_entry(
 ) -> None:
     """Set up ecoNEXT switch entities from a config entry."""
     coordinator: EconextCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
 
     entities: list[EconextSwitch] = []
 
@@ -38,7 +40,7 @@ async def async_setup_entry(
         # Only add if parameter exists in data
         if coordinator.get_param(description.param_id) is not None:
             entities.append(EconextSwitch(coordinator, description))
-        else:
+        elif debug_enabled:
             _LOGGER.debug(
                 "Skipping switch %s - parameter %s not found",
                 description.key,
@@ -46,19 +48,16 @@ async def async_setup_entry(
             )
 
     # Add DHW switch entities if DHW device should be created
-    dhw_temp_param = coordinator.get_param("61")
-    if dhw_temp_param is not None:
-        dhw_temp_value = dhw_temp_param.get("value")
-        if dhw_temp_value is not None and dhw_temp_value != 999.0:
-            for description in DHW_SWITCHES:
-                if coordinator.get_param(description.param_id) is not None:
-                    entities.append(EconextSwitch(coordinator, description))
-                else:
-                    _LOGGER.debug(
-                        "Skipping DHW switch %s - parameter %s not found",
-                        description.key,
-                        description.param_id,
-                    )
+    if coordinator.dhw_available:
+        for description in DHW_SWITCHES:
+            if coordinator.get_param(description.param_id) is not None:
+                entities.append(EconextSwitch(coordinator, description))
+            elif debug_enabled:
+                _LOGGER.debug(
+                    "Skipping DHW switch %s - parameter %s not found",
+                    description.key,
+                    description.param_id,
+                )
 
     # Add heat pump switch entities if heat pump device should be created
     heatpump_param = coordinator.get_param("1133")
@@ -66,7 +65,7 @@ async def async_setup_entry(
         for description in HEATPUMP_SWITCHES:
             if coordinator.get_param(description.param_id) is not None:
                 entities.append(EconextSwitch(coordinator, description, device_id="heatpump"))
-            else:
+            elif debug_enabled:
                 _LOGGER.debug(
                     "Skipping heat pump switch %s - parameter %s not found",
                     description.key,
@@ -74,30 +73,22 @@ async def async_setup_entry(
                 )
 
     # Add circuit switch entities if circuit is active
-    for circuit_num, circuit in CIRCUITS.items():
-        active = coordinator.get_param(circuit.active_param)
-        if active and active.get("value", 0) > 0:
-            for description in CIRCUIT_SWITCHES:
-                param_id = circuit.settings_param
-                if param_id and coordinator.get_param(param_id) is not None:
-                    # Create a copy of the description with the actual param_id
-                    circuit_desc = EconextSwitchEntityDescription(
-                        key=description.key,
-                        param_id=param_id,
-                        device_type=description.device_type,
-                        entity_category=description.entity_category,
-                        icon=description.icon,
-                        bit_position=description.bit_position,
-                        invert_logic=description.invert_logic,
-                    )
-                    entities.append(EconextSwitch(coordinator, circuit_desc, device_id=f"circuit_{circuit_num}"))
-                else:
-                    _LOGGER.debug(
-                        "Skipping Circuit %s switch %s - parameter %s not found",
-                        circuit_num,
-                        description.key,
-                        param_id,
-                    )
+    for circuit_num, circuit in coordinator.get_active_circuits(CIRCUITS):
+        device_id = CIRCUIT_DEVICE_IDS[circuit_num]
+
+        for description in CIRCUIT_SWITCHES:
+            param_id = circuit.settings_param
+            if param_id and coordinator.get_param(param_id) is not None:
+                # Create a copy of the description with the actual param_id
+                circuit_desc = replace(description, param_id=param_id)
+                entities.append(EconextSwitch(coordinator, circuit_desc, device_id=device_id))
+            elif debug_enabled:
+                _LOGGER.debug(
+                    "Skipping Circuit %s switch %s - parameter %s not found",
+                    circuit_num,
+                    description.key,
+                    param_id,
+                )
 
     # Thermostat pairing switch
     if entry.options.get(CONF_THERMOSTAT_ENTITY):
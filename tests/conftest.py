@@ -1,9 +1,11 @@
 """Test configuration for econext integration tests."""
 
+import copy
 import json
 import sys
+from collections.abc import Callable
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from aiohttp import ClientSession
@@ -12,21 +14,36 @@ from aiohttp import ClientSession
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session", autouse=True)
+def patch_frame_helper():
+    """Patch Home Assistant frame helper once for the whole test session."""
+    with patch("homeassistant.helpers.frame.report_usage"):
+        yield
+
+
+@pytest.fixture(scope="session")
 def fixture_path() -> Path:
     """Return the path to test fixtures."""
     return Path(__file__).parent / "fixtures"
 
 
+@pytest.fixture(scope="session")
+def _all_params_source(fixture_path: Path) -> dict:
+    """Load the parameters.json fixture once per session (shared - never mutate)."""
+    with open(fixture_path / "parameters.json") as f:
+        return json.load(f)
+
+
 @pytest.fixture
-def all_params_response(fixture_path: Path) -> dict:
-    """Load the parameters.json fixture in index-keyed format.
+def all_params_response(_all_params_source: dict) -> dict:
+    """Return the parameters.json fixture in index-keyed format.
 
     This represents the format AFTER the API client transforms the gateway response.
-    Used by coordinator and entity tests.
+    Used by coordinator and entity tests. Copied per test since tests mutate
+    coordinator data in place; each param is a flat dict of scalars, so copying
+    one level down is a full copy at a fraction of deepcopy's cost.
     """
-    with open(fixture_path / "parameters.json") as f:
-        return json.load(f)
+    return {param_id: dict(param) for param_id, param in _all_params_source.items()}
 
 
 @pytest.fixture
@@ -35,14 +52,14 @@ def all_params_parsed(all_params_response: dict) -> dict:
     return all_params_response
 
 
-@pytest.fixture
-def gateway_api_response(all_params_response: dict) -> dict:
-    """Create a gateway-format API response from the fixture.
+@pytest.fixture(scope="session")
+def _gateway_api_response_template(_all_params_source: dict) -> dict:
+    """Build the gateway-format API response from the fixture once per session.
 
     Gateway returns index-keyed: {"timestamp": "...", "parameters": {"0": {"index": 0, "name": "PS", ...}}}
     """
     parameters = {}
-    for index_str, param_data in all_params_response.items():
+    for index_str, param_data in _all_params_source.items():
         parameters[index_str] = {
             "index": int(index_str),
             "name": param_data.get("name", f"param_{index_str}"),
@@ -56,6 +73,12 @@ def gateway_api_response(all_params_response: dict) -> dict:
     return {"timestamp": "2026-02-06T12:00:00", "parameters": parameters}
 
 
+@pytest.fixture
+def gateway_api_response(_gateway_api_response_template: dict) -> dict:
+    """Return a per-test copy of the gateway-format API response."""
+    return copy.deepcopy(_gateway_api_response_template)
+
+
 @pytest.fixture
 def mock_session() -> MagicMock:
     """Create a mock aiohttp ClientSession."""
@@ -69,3 +92,19 @@ def mock_response() -> MagicMock:
     response = MagicMock()
     response.status = 200
     return response
+
+
+@pytest.fixture
+def make_aiohttp_response() -> Callable[..., AsyncMock]:
+    """Return a factory for mock aiohttp responses usable as async context managers."""
+
+    def _make(status: int = 200, json_payload: dict | None = None) -> AsyncMock:
+        response = AsyncMock()
+        response.status = status
+        if json_payload is not None:
+            response.json = AsyncMock(return_value=json_payload)
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=None)
+        return response
+
+    return _make
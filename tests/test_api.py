@@ -1,5 +1,6 @@
 """Tests for the econext API client."""
 
+from collections.abc import Callable
 from unittest.mock import AsyncMock, MagicMock
 
 import aiohttp
@@ -12,17 +13,17 @@ from custom_components.econext.api import (
 )
 
 
+@pytest.fixture
+def api(mock_session: MagicMock) -> EconextApi:
+    """Create an API client bound to the mock session."""
+    return EconextApi(host="192.168.1.100", port=8000, session=mock_session)
+
+
 class TestEconextApi:
     """Test the EconextApi class."""
 
-    def test_init(self, mock_session: MagicMock) -> None:
+    def test_init(self, api: EconextApi) -> None:
         """Test API client initialization."""
-        api = EconextApi(
-            host="192.168.1.100",
-            port=8000,
-            session=mock_session,
-        )
-
         assert api.host == "192.168.1.100"
         assert api.port == 8000
         assert api._base_url == "http://192.168.1.100:8000"
@@ -41,27 +42,18 @@ class TestEconextApi:
 class TestFetchAllParams:
     """Test the async_fetch_all_params method."""
 
-    @pytest.mark.asyncio
     async def test_fetch_all_params_success(
         self,
+        api: EconextApi,
         mock_session: MagicMock,
+        make_aiohttp_response: Callable[..., AsyncMock],
         gateway_api_response: dict,
     ) -> None:
         """Test successful fetch of all parameters."""
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.json = AsyncMock(return_value=gateway_api_response)
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
+        mock_response = make_aiohttp_response(200, gateway_api_response)
 
         mock_session.get = MagicMock(return_value=mock_response)
 
-        api = EconextApi(
-            host="192.168.1.100",
-            port=8000,
-            session=mock_session,
-        )
-
         result = await api.async_fetch_all_params()
 
         assert isinstance(result, dict)
@@ -73,10 +65,11 @@ class TestFetchAllParams:
         assert result["374"]["name"] == "Nazwa"
         assert result["374"]["value"] == "ecoMAX360i"
 
-    @pytest.mark.asyncio
     async def test_fetch_all_params_transforms_fields(
         self,
+        api: EconextApi,
         mock_session: MagicMock,
+        make_aiohttp_response: Callable[..., AsyncMock],
     ) -> None:
         """Test that gateway fields are correctly mapped."""
         gateway_response = {
@@ -95,15 +88,10 @@ class TestFetchAllParams:
             },
         }
 
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.json = AsyncMock(return_value=gateway_response)
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
+        mock_response = make_aiohttp_response(200, gateway_response)
 
         mock_session.get = MagicMock(return_value=mock_response)
 
-        api = EconextApi(host="192.168.1.100", port=8000, session=mock_session)
         result = await api.async_fetch_all_params()
 
         assert "42" in result
@@ -114,28 +102,21 @@ class TestFetchAllParams:
         assert param["maxv"] == 200.0
         assert param["writable"] is True
 
-    @pytest.mark.asyncio
-    async def test_fetch_all_params_api_error(self, mock_session: MagicMock) -> None:
+    async def test_fetch_all_params_api_error(
+        self, api: EconextApi, mock_session: MagicMock, make_aiohttp_response: Callable[..., AsyncMock]
+    ) -> None:
         """Test API error handling for non-200 status."""
-        mock_response = AsyncMock()
-        mock_response.status = 500
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
+        mock_response = make_aiohttp_response(500)
 
         mock_session.get = MagicMock(return_value=mock_response)
 
-        api = EconextApi(host="192.168.1.100", port=8000, session=mock_session)
-
         with pytest.raises(EconextApiError, match="status 500"):
             await api.async_fetch_all_params()
 
-    @pytest.mark.asyncio
-    async def test_fetch_all_params_connection_error(self, mock_session: MagicMock) -> None:
+    async def test_fetch_all_params_connection_error(self, api: EconextApi, mock_session: MagicMock) -> None:
         """Test connection error handling."""
         mock_session.get = MagicMock(side_effect=aiohttp.ClientError("Connection failed"))
 
-        api = EconextApi(host="192.168.1.100", port=8000, session=mock_session)
-
         with pytest.raises(EconextConnectionError, match="Connection error"):
             await api.async_fetch_all_params()
 
@@ -143,18 +124,14 @@ class TestFetchAllParams:
 class TestSetParam:
     """Test the async_set_param method."""
 
-    @pytest.mark.asyncio
-    async def test_set_param_success(self, mock_session: MagicMock) -> None:
+    async def test_set_param_success(
+        self, api: EconextApi, mock_session: MagicMock, make_aiohttp_response: Callable[..., AsyncMock]
+    ) -> None:
         """Test successful parameter set via POST."""
-        set_response = AsyncMock()
-        set_response.status = 200
-        set_response.__aenter__ = AsyncMock(return_value=set_response)
-        set_response.__aexit__ = AsyncMock(return_value=None)
+        set_response = make_aiohttp_response(200)
 
         mock_session.post = MagicMock(return_value=set_response)
 
-        api = EconextApi(host="192.168.1.100", port=8000, session=mock_session)
-
         result = await api.async_set_param("dhwTarget", 45)
 
         assert result is True
@@ -164,18 +141,14 @@ class TestSetParam:
         assert "/api/parameters/dhwTarget" in call_args[0][0]
         assert call_args[1]["json"] == {"value": 45}
 
-    @pytest.mark.asyncio
-    async def test_set_param_api_error(self, mock_session: MagicMock) -> None:
+    async def test_set_param_api_error(
+        self, api: EconextApi, mock_session: MagicMock, make_aiohttp_response: Callable[..., AsyncMock]
+    ) -> None:
         """Test API error when setting parameter."""
-        mock_response = AsyncMock()
-        mock_response.status = 500
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
+        mock_response = make_aiohttp_response(500)
 
         mock_session.post = MagicMock(return_value=mock_response)
 
-        api = EconextApi(host="192.168.1.100", port=8000, session=mock_session)
-
         with pytest.raises(EconextApiError, match="status 500"):
             await api.async_set_param("dhwTarget", 45)
 
@@ -183,23 +156,18 @@ class TestSetParam:
 class TestTestConnection:
     """Test the async_test_connection method."""
 
-    @pytest.mark.asyncio
     async def test_connection_returns_device_info(
         self,
+        api: EconextApi,
         mock_session: MagicMock,
+        make_aiohttp_response: Callable[..., AsyncMock],
         gateway_api_response: dict,
     ) -> None:
         """Test that test_connection returns device info."""
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.json = AsyncMock(return_value=gateway_api_response)
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
+        mock_response = make_aiohttp_response(200, gateway_api_response)
 
         mock_session.get = MagicMock(return_value=mock_response)
 
-        api = EconextApi(host="192.168.1.100", port=8000, session=mock_session)
-
         result = await api.async_test_connection()
 
         assert "uid" in result
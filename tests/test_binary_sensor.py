@@ -1,122 +1,114 @@
 """Tests for the binary_sensor platform."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock
 
 import pytest
+from homeassistant.core import HomeAssistant
 
+from custom_components.econext.api import EconextApi
 from custom_components.econext.binary_sensor import EconextAlarmActiveBinarySensor
 from custom_components.econext.coordinator import EconextCoordinator
 
-
-@pytest.fixture(autouse=True)
-def patch_frame_helper():
-    """Patch Home Assistant frame helper for all tests."""
-    with patch("homeassistant.helpers.frame.report_usage"):
-        yield
+# Alarm history entries as returned by the gateway (to_date None = still active)
+ACTIVE_ALARM = {"code": 218, "from_date": "2026-01-15 10:00:00", "to_date": None}
+RESOLVED_ALARM = {"code": 218, "from_date": "2026-01-15 10:00:00", "to_date": "2026-01-15 12:00:00"}
+OLDER_RESOLVED_ALARM = {"code": 100, "from_date": "2026-01-10 08:00:00", "to_date": "2026-01-10 09:00:00"}
 
 
-@pytest.fixture
-def mock_hass() -> MagicMock:
-    """Create a mock Home Assistant instance."""
-    hass = MagicMock()
-    return hass
+@pytest.fixture(scope="module")
+def mock_hass() -> Mock:
+    """Create a mock Home Assistant instance (spec'd Mock - no magic-method children needed)."""
+    return Mock(spec=HomeAssistant)
 
 
-@pytest.fixture
-def mock_api() -> MagicMock:
+@pytest.fixture(scope="module")
+def mock_api() -> Mock:
     """Create a mock API."""
-    return MagicMock()
+    return Mock(spec=EconextApi)
+
 
+@pytest.fixture(scope="module")
+def coordinator(mock_hass: Mock, mock_api: Mock, _all_params_source: dict) -> EconextCoordinator:
+    """Create a coordinator shared by the module.
 
-@pytest.fixture
-def coordinator(mock_hass: MagicMock, mock_api: MagicMock, all_params_parsed: dict) -> EconextCoordinator:
-    """Create a coordinator with data."""
+    Tests here only change alarms, never parameter data, so the read-only
+    session params source is used directly.
+    """
     coordinator = EconextCoordinator(mock_hass, mock_api)
-    coordinator.data = all_params_parsed
+    coordinator.data = _all_params_source
     return coordinator
 
 
-class TestAlarmActiveBinarySensor:
-    """Test alarm active binary sensor."""
-
-    def test_no_active_alarms(self, coordinator: EconextCoordinator) -> None:
-        """Test sensor is off when no alarms are active."""
-        coordinator._alarms = []
-
-        sensor = EconextAlarmActiveBinarySensor(coordinator)
-
-        assert sensor.is_on is False
-
-    def test_active_alarm_present(self, coordinator: EconextCoordinator) -> None:
-        """Test sensor is on when an unresolved alarm exists."""
-        coordinator._alarms = [
-            {"code": 218, "from_date": "2026-01-15 10:00:00", "to_date": None},
-        ]
-
-        sensor = EconextAlarmActiveBinarySensor(coordinator)
-
-        assert sensor.is_on is True
-
-    def test_only_resolved_alarms(self, coordinator: EconextCoordinator) -> None:
-        """Test sensor is off when all alarms are resolved."""
-        coordinator._alarms = [
-            {"code": 218, "from_date": "2026-01-15 10:00:00", "to_date": "2026-01-15 12:00:00"},
-            {"code": 100, "from_date": "2026-01-10 08:00:00", "to_date": "2026-01-10 09:00:00"},
-        ]
-
-        sensor = EconextAlarmActiveBinarySensor(coordinator)
-
-        assert sensor.is_on is False
-
-    def test_mixed_active_and_resolved(self, coordinator: EconextCoordinator) -> None:
-        """Test sensor is on when mix of active and resolved alarms."""
-        coordinator._alarms = [
-            {"code": 218, "from_date": "2026-01-15 10:00:00", "to_date": None},
-            {"code": 100, "from_date": "2026-01-10 08:00:00", "to_date": "2026-01-10 09:00:00"},
-        ]
-
-        sensor = EconextAlarmActiveBinarySensor(coordinator)
-
-        assert sensor.is_on is True
-
-    def test_extra_state_attributes_no_alarms(self, coordinator: EconextCoordinator) -> None:
-        """Test extra state attributes when no alarms."""
-        coordinator._alarms = []
+@pytest.fixture(autouse=True)
+def reset_alarms(coordinator: EconextCoordinator) -> None:
+    """Clear alarms on the shared coordinator before each test."""
+    coordinator._alarms = []
 
-        sensor = EconextAlarmActiveBinarySensor(coordinator)
-        attrs = sensor.extra_state_attributes
 
-        assert attrs["active_alarm_count"] == 0
-        assert attrs["active_alarm_codes"] == []
+@pytest.fixture(scope="module")
+def alarm_sensor(coordinator: EconextCoordinator) -> EconextAlarmActiveBinarySensor:
+    """Create one alarm active binary sensor for the module.
 
-    def test_extra_state_attributes_with_active(self, coordinator: EconextCoordinator) -> None:
-        """Test extra state attributes include active alarm details."""
-        coordinator._alarms = [
-            {"code": 218, "from_date": "2026-01-15 10:00:00", "to_date": None},
-        ]
+    The sensor reads alarms lazily from the coordinator, so resetting
+    ``_alarms`` between tests is enough to isolate them.
+    """
+    return EconextAlarmActiveBinarySensor(coordinator)
 
-        sensor = EconextAlarmActiveBinarySensor(coordinator)
-        attrs = sensor.extra_state_attributes
 
-        assert attrs["active_alarm_count"] == 1
-        assert len(attrs["active_alarm_codes"]) == 1
-        assert attrs["active_alarm_codes"][0]["code"] == 218
+class TestAlarmActiveBinarySensor:
+    """Test alarm active binary sensor."""
 
-    def test_unique_id(self, coordinator: EconextCoordinator) -> None:
-        """Test binary sensor has correct unique ID."""
+    @pytest.mark.parametrize(
+        ("alarms", "expected"),
+        [
+            ([], False),
+            ([ACTIVE_ALARM], True),
+            ([RESOLVED_ALARM, OLDER_RESOLVED_ALARM], False),
+            ([ACTIVE_ALARM, OLDER_RESOLVED_ALARM], True),
+        ],
+        ids=["no_alarms", "active", "only_resolved", "mixed"],
+    )
+    def test_is_on(
+        self,
+        coordinator: EconextCoordinator,
+        alarm_sensor: EconextAlarmActiveBinarySensor,
+        alarms: list[dict],
+        expected: bool,
+    ) -> None:
+        """Test sensor is on only while an unresolved alarm exists."""
+        coordinator._alarms = alarms
+
+        assert alarm_sensor.is_on is expected
+
+    @pytest.mark.parametrize(
+        ("alarms", "expected_codes"),
+        [
+            ([], []),
+            ([ACTIVE_ALARM], [218]),
+        ],
+        ids=["no_alarms", "active"],
+    )
+    def test_extra_state_attributes(
+        self,
+        coordinator: EconextCoordinator,
+        alarm_sensor: EconextAlarmActiveBinarySensor,
+        alarms: list[dict],
+        expected_codes: list[int],
+    ) -> None:
+        """Test extra state attributes list the active alarm details."""
+        coordinator._alarms = alarms
+
+        attrs = alarm_sensor.extra_state_attributes
+
+        assert attrs["active_alarm_count"] == len(expected_codes)
+        assert [a["code"] for a in attrs["active_alarm_codes"]] == expected_codes
+
+    def test_static_properties(self, coordinator: EconextCoordinator) -> None:
+        """Test unique ID, device class and validity of a freshly built sensor."""
         sensor = EconextAlarmActiveBinarySensor(coordinator)
 
         uid = coordinator.get_device_uid()
         assert sensor.unique_id == f"{uid}_alarm_active"
-
-    def test_device_class(self, coordinator: EconextCoordinator) -> None:
-        """Test binary sensor device class is problem."""
-        sensor = EconextAlarmActiveBinarySensor(coordinator)
-
         assert sensor.device_class.value == "problem"
-
-    def test_always_available(self, coordinator: EconextCoordinator) -> None:
-        """Test alarm sensor is always valid (reads alarm data, not params)."""
-        sensor = EconextAlarmActiveBinarySensor(coordinator)
-
+        # Always valid - reads alarm data, not params
         assert sensor._is_value_valid() is True
@@ -1,6 +1,7 @@
 """Tests for the econext climate platform."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections.abc import Callable
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
 from homeassistant.components.climate import (
@@ -9,28 +10,29 @@ from homeassistant.components.climate import (
     HVACMode,
 )
 from homeassistant.components.climate.const import PRESET_BOOST, PRESET_COMFORT, PRESET_ECO
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 
-from custom_components.econext.climate import CIRCUITS, CircuitClimate, CircuitWorkState, async_setup_entry
+from custom_components.econext.climate import (
+    CIRCUITS,
+    PRESET_SCHEDULE,
+    SETTINGS_COOLING_ENABLED,
+    SETTINGS_HEATING_DISABLED,
+    CircuitClimate,
+    CircuitWorkState,
+    async_setup_entry,
+)
 from custom_components.econext.coordinator import EconextCoordinator
 
 
-@pytest.fixture(autouse=True)
-def patch_frame_helper():
-    """Patch Home Assistant frame helper for all tests."""
-    with patch("homeassistant.helpers.frame.report_usage"):
-        yield
-
-
-@pytest.fixture
-def mock_hass() -> MagicMock:
-    """Create a mock Home Assistant instance."""
-    hass = MagicMock(spec=HomeAssistant)
-    return hass
+@pytest.fixture(scope="module")
+def mock_hass() -> Mock:
+    """Create a mock Home Assistant instance (only hass.data is used)."""
+    return Mock(spec=HomeAssistant)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_api() -> MagicMock:
     """Create a mock API."""
     api = MagicMock()
@@ -38,15 +40,72 @@ def mock_api() -> MagicMock:
     return api
 
 
-@pytest.fixture
-def coordinator(mock_hass: MagicMock, mock_api: MagicMock, all_params_parsed: dict) -> EconextCoordinator:
-    """Create a coordinator with data."""
+@pytest.fixture(scope="module")
+def _shared_coordinator(mock_hass: Mock, mock_api: MagicMock) -> EconextCoordinator:
+    """Create the coordinator once per module (data is swapped in per test)."""
     coordinator = EconextCoordinator(mock_hass, mock_api)
-    coordinator.data = all_params_parsed
     coordinator.async_set_param = AsyncMock()
     return coordinator
 
 
+@pytest.fixture
+def coordinator(_shared_coordinator: EconextCoordinator, all_params_parsed: dict) -> EconextCoordinator:
+    """Return the shared coordinator with a fresh copy of the fixture data.
+
+    all_params_parsed is copied per test, so tests may mutate data in place.
+    """
+    _shared_coordinator.data = all_params_parsed
+    _shared_coordinator.async_set_param.reset_mock()
+    return _shared_coordinator
+
+
+def _build_circuit_entity(coordinator: EconextCoordinator, circuit_num: int) -> CircuitClimate:
+    """Construct a circuit climate entity from its CIRCUITS configuration."""
+    circuit = CIRCUITS[circuit_num]
+    return CircuitClimate(
+        coordinator,
+        circuit_num=circuit_num,
+        name_param=circuit.name_param,
+        work_state_param=circuit.work_state_param,
+        settings_param=circuit.settings_param,
+        thermostat_param=circuit.thermostat_param,
+        comfort_param=circuit.comfort_param,
+        eco_param=circuit.eco_param,
+        room_temp_setpoint_param=circuit.room_temp_setpoint_param,
+        boost_time_left_param=circuit.boost_time_left_param,
+    )
+
+
+@pytest.fixture
+def make_circuit_entity(coordinator: EconextCoordinator) -> Callable[..., CircuitClimate]:
+    """Return a factory for circuit climate entities.
+
+    Build the entity after adjusting coordinator data, since the name is read at init.
+    """
+
+    def _make(circuit_num: int = 2) -> CircuitClimate:
+        return _build_circuit_entity(coordinator, circuit_num)
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def _shared_circuit_2_entity(_shared_coordinator: EconextCoordinator, _all_params_source: dict) -> CircuitClimate:
+    """Build the Circuit 2 entity once per module from unmodified fixture data."""
+    _shared_coordinator.data = _all_params_source
+    return _build_circuit_entity(_shared_coordinator, 2)
+
+
+@pytest.fixture
+def circuit_2_entity(coordinator: EconextCoordinator, _shared_circuit_2_entity: CircuitClimate) -> CircuitClimate:
+    """Return the shared Circuit 2 entity backed by this test's coordinator data.
+
+    _last_preset is the only state the entity keeps, so clear it between tests.
+    """
+    _shared_circuit_2_entity._last_preset = None
+    return _shared_circuit_2_entity
+
+
 class TestCircuitConfiguration:
     """Test circuit configuration constants."""
 
@@ -88,42 +147,34 @@ class TestCircuitConfiguration:
 class TestAsyncSetupEntry:
     """Test async_setup_entry function."""
 
-    @pytest.mark.asyncio
-    async def test_setup_creates_all_circuits_in_fixture(
-        self, mock_hass: MagicMock, coordinator: EconextCoordinator
-    ) -> None:
-        """Test only active circuits create climate entities from fixture data."""
-        mock_entry = MagicMock()
-        mock_entry.entry_id = "test_entry"
+    @pytest.fixture
+    def hass_with_entry(self, mock_hass: Mock, coordinator: EconextCoordinator) -> tuple[Mock, Mock]:
+        """Register the coordinator under a config entry and return (hass, entry)."""
         mock_hass.data = {"econext": {"test_entry": {"coordinator": coordinator}}}
+        return mock_hass, Mock(spec=ConfigEntry, entry_id="test_entry")
 
-        entities_added = []
-
-        def mock_add_entities(entities):
-            entities_added.extend(entities)
+    async def test_setup_creates_all_circuits_in_fixture(self, hass_with_entry: tuple[Mock, Mock]) -> None:
+        """Test only active circuits create climate entities from fixture data."""
+        mock_hass, mock_entry = hass_with_entry
 
-        await async_setup_entry(mock_hass, mock_entry, mock_add_entities)
+        entities_added = []
+        await async_setup_entry(mock_hass, mock_entry, entities_added.extend)
 
         # Only Circuit 2 is active in fixture (value=1)
         assert len(entities_added) == 1
         assert entities_added[0]._circuit_num == 2
 
-    @pytest.mark.asyncio
-    async def test_setup_skips_inactive_circuits(self, mock_hass: MagicMock, coordinator: EconextCoordinator) -> None:
+    async def test_setup_skips_inactive_circuits(
+        self, hass_with_entry: tuple[Mock, Mock], coordinator: EconextCoordinator
+    ) -> None:
         """Test circuits with active param value=0 are skipped."""
-        mock_entry = MagicMock()
-        mock_entry.entry_id = "test_entry"
-        mock_hass.data = {"econext": {"test_entry": {"coordinator": coordinator}}}
+        mock_hass, mock_entry = hass_with_entry
 
         # Activate Circuit 1 by setting its active param to 1
         coordinator.data["279"]["value"] = 1
 
         entities_added = []
-
-        def mock_add_entities(entities):
-            entities_added.extend(entities)
-
-        await async_setup_entry(mock_hass, mock_entry, mock_add_entities)
+        await async_setup_entry(mock_hass, mock_entry, entities_added.extend)
 
         # Both Circuit 1 and Circuit 2 should be created
         circuit_nums = {e._circuit_num for e in entities_added}
@@ -134,152 +185,72 @@ class TestAsyncSetupEntry:
 class TestCircuitClimate:
     """Test CircuitClimate entity."""
 
-    @pytest.fixture
-    def circuit_2_entity(self, coordinator: EconextCoordinator) -> CircuitClimate:
-        """Create Circuit 2 climate entity."""
-        circuit = CIRCUITS[2]
-        return CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
-
-    def test_entity_initialization(self, circuit_2_entity: CircuitClimate) -> None:
-        """Test climate entity initialization."""
-        assert circuit_2_entity._circuit_num == 2
-        assert circuit_2_entity._attr_temperature_unit == UnitOfTemperature.CELSIUS
-        assert circuit_2_entity._attr_translation_key == "circuit"
-
-    def test_entity_name_from_controller(self, circuit_2_entity: CircuitClimate) -> None:
-        """Test entity uses custom name from controller."""
-        # From fixture, Circuit2name = "UFH "
-        assert circuit_2_entity._attr_name == "UFH"  # Stripped
-
-    def test_supported_features(self, circuit_2_entity: CircuitClimate) -> None:
-        """Test entity has correct supported features."""
-        expected = ClimateEntityFeature.PRESET_MODE | ClimateEntityFeature.TARGET_TEMPERATURE
-        assert circuit_2_entity.supported_features == expected
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            ("_circuit_num", 2),
+            ("_attr_temperature_unit", UnitOfTemperature.CELSIUS),
+            ("_attr_translation_key", "circuit"),
+            # From fixture, Circuit2name = "UFH " (stripped)
+            ("_attr_name", "UFH"),
+            ("supported_features", ClimateEntityFeature.PRESET_MODE | ClimateEntityFeature.TARGET_TEMPERATURE),
+            ("_attr_preset_modes", [PRESET_ECO, PRESET_COMFORT, PRESET_SCHEDULE, PRESET_BOOST]),
+            ("_attr_min_temp", 10.0),
+            ("_attr_max_temp", 35.0),
+            ("_attr_target_temperature_step", 0.1),
+            # UID from fixture is "2L7SDPN6KQ38CIH2401K01U", device_id is "circuit_2", work_state_param is "286"
+            ("_attr_unique_id", "2L7SDPN6KQ38CIH2401K01U_circuit_2_286"),
+        ],
+    )
+    def test_static_attributes(self, circuit_2_entity: CircuitClimate, attr: str, expected: object) -> None:
+        """Test attributes fixed at init or on the class."""
+        assert getattr(circuit_2_entity, attr) == expected
 
     def test_hvac_modes(self, circuit_2_entity: CircuitClimate) -> None:
         """Test entity has correct HVAC modes."""
-        modes = circuit_2_entity.hvac_modes
-        assert HVACMode.OFF in modes
-        assert HVACMode.AUTO in modes
-        assert HVACMode.HEAT in modes
         # Cooling support (param 485) = 1 in fixture, so COOL is available
-        assert HVACMode.COOL in modes
-
-    def test_preset_modes(self, circuit_2_entity: CircuitClimate) -> None:
-        """Test entity has correct preset modes."""
-        from custom_components.econext.climate import PRESET_SCHEDULE
-
-        assert circuit_2_entity._attr_preset_modes == [PRESET_ECO, PRESET_COMFORT, PRESET_SCHEDULE, PRESET_BOOST]
-
-    def test_temperature_limits(self, circuit_2_entity: CircuitClimate) -> None:
-        """Test entity has correct temperature limits."""
-        assert circuit_2_entity._attr_min_temp == 10.0
-        assert circuit_2_entity._attr_max_temp == 35.0
-        assert circuit_2_entity._attr_target_temperature_step == 0.1
+        assert circuit_2_entity.hvac_modes == [HVACMode.OFF, HVACMode.AUTO, HVACMode.HEAT, HVACMode.COOL]
 
     def test_current_temperature(self, circuit_2_entity: CircuitClimate) -> None:
         """Test current temperature from thermostat."""
         # From fixture, Circuit2thermostatTemp = 19.93
         assert circuit_2_entity.current_temperature == 19.93
 
-    def test_current_temperature_invalid(self, coordinator: EconextCoordinator) -> None:
+    def test_current_temperature_invalid(
+        self, coordinator: EconextCoordinator, make_circuit_entity: Callable[..., CircuitClimate]
+    ) -> None:
         """Test current temperature returns None for invalid value."""
         # Modify fixture to have invalid temp
         coordinator.data["327"]["value"] = 999.0
 
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
+        entity = make_circuit_entity()
 
         assert entity.current_temperature is None
 
-    def test_hvac_mode_off(self, coordinator: EconextCoordinator) -> None:
-        """Test HVAC mode when circuit is off."""
-        # Set work state to 0 (off)
-        coordinator.data["286"]["value"] = 0
-
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
-
-        assert entity.hvac_mode == HVACMode.OFF
-
-    def test_hvac_mode_heat_eco(self, coordinator: EconextCoordinator) -> None:
-        """Test HVAC mode when circuit is in eco mode with only heating enabled."""
-        # Set work state to 1 (eco)
-        coordinator.data["286"]["value"] = 1
-        # Set heating enabled (bit 20 = 0), cooling disabled (bit 17 = 0)
+    @pytest.mark.parametrize(
+        ("work_state", "expected"),
+        [
+            (CircuitWorkState.OFF, HVACMode.OFF),
+            (CircuitWorkState.COMFORT, HVACMode.HEAT),
+            (CircuitWorkState.ECO, HVACMode.HEAT),
+        ],
+        ids=["off", "comfort", "eco"],
+    )
+    def test_hvac_mode(
+        self,
+        coordinator: EconextCoordinator,
+        make_circuit_entity: Callable[..., CircuitClimate],
+        work_state: CircuitWorkState,
+        expected: HVACMode,
+    ) -> None:
+        """Test HVAC mode per work state with only heating enabled."""
+        coordinator.data["286"]["value"] = work_state
+        # Heating enabled (bit 20 = 0), cooling disabled (bit 17 = 0)
         coordinator.data["281"]["value"] = 0
 
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
-
-        assert entity.hvac_mode == HVACMode.HEAT
-
-    def test_hvac_mode_heat_comfort(self, coordinator: EconextCoordinator) -> None:
-        """Test HVAC mode when circuit is in comfort mode with only heating enabled."""
-        # Set work state to 2 (comfort)
-        coordinator.data["286"]["value"] = 2
-        # Set heating enabled (bit 20 = 0), cooling disabled (bit 17 = 0)
-        coordinator.data["281"]["value"] = 0
+        entity = make_circuit_entity()
 
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
-
-        assert entity.hvac_mode == HVACMode.HEAT
+        assert entity.hvac_mode == expected
 
     def test_hvac_mode_schedule(self, circuit_2_entity: CircuitClimate) -> None:
         """Test HVAC mode when circuit is in schedule mode."""
@@ -288,95 +259,57 @@ class TestCircuitClimate:
         # Fixture has both heating and cooling enabled, so returns AUTO
         assert circuit_2_entity.hvac_mode == HVACMode.AUTO
 
-    def test_preset_mode_eco(self, coordinator: EconextCoordinator) -> None:
-        """Test preset mode when in eco."""
-        coordinator.data["286"]["value"] = CircuitWorkState.ECO
+    @pytest.mark.parametrize(
+        ("work_state", "expected"),
+        [
+            (CircuitWorkState.ECO, PRESET_ECO),
+            (CircuitWorkState.COMFORT, PRESET_COMFORT),
+        ],
+        ids=["eco", "comfort"],
+    )
+    def test_preset_mode(
+        self,
+        coordinator: EconextCoordinator,
+        make_circuit_entity: Callable[..., CircuitClimate],
+        work_state: CircuitWorkState,
+        expected: str,
+    ) -> None:
+        """Test preset mode follows the eco/comfort work state."""
+        coordinator.data["286"]["value"] = work_state
 
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
-
-        assert entity.preset_mode == PRESET_ECO
-
-    def test_preset_mode_comfort(self, coordinator: EconextCoordinator) -> None:
-        """Test preset mode when in comfort."""
-        coordinator.data["286"]["value"] = CircuitWorkState.COMFORT
+        entity = make_circuit_entity()
 
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
-
-        assert entity.preset_mode == PRESET_COMFORT
+        assert entity.preset_mode == expected
 
     def test_preset_mode_schedule(self, circuit_2_entity: CircuitClimate) -> None:
         """Test preset mode returns SCHEDULE when in schedule/auto mode."""
-        from custom_components.econext.climate import PRESET_SCHEDULE
-
         # From fixture: Circuit2WorkState = 3 (schedule/auto)
         # Should return PRESET_SCHEDULE
         assert circuit_2_entity.preset_mode == PRESET_SCHEDULE
 
-    def test_target_temperature_comfort(self, coordinator: EconextCoordinator) -> None:
-        """Test target temperature in comfort mode."""
-        coordinator.data["286"]["value"] = CircuitWorkState.COMFORT
+    @pytest.mark.parametrize(
+        ("work_state", "expected"),
+        [
+            # From fixture, Circuit2ComfortTemp = 21.0
+            (CircuitWorkState.COMFORT, 21.0),
+            # From fixture, Circuit2EcoTemp = 17.5
+            (CircuitWorkState.ECO, 17.5),
+        ],
+        ids=["comfort", "eco"],
+    )
+    def test_target_temperature(
+        self,
+        coordinator: EconextCoordinator,
+        make_circuit_entity: Callable[..., CircuitClimate],
+        work_state: CircuitWorkState,
+        expected: float,
+    ) -> None:
+        """Test target temperature follows the eco/comfort work state."""
+        coordinator.data["286"]["value"] = work_state
 
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
-
-        # From fixture, Circuit2ComfortTemp = 21.0
-        assert entity.target_temperature == 21.0
-
-    def test_target_temperature_eco(self, coordinator: EconextCoordinator) -> None:
-        """Test target temperature in eco mode."""
-        coordinator.data["286"]["value"] = CircuitWorkState.ECO
+        entity = make_circuit_entity()
 
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
-
-        # From fixture, Circuit2EcoTemp = 17.5
-        assert entity.target_temperature == 17.5
+        assert entity.target_temperature == expected
 
     def test_target_temperature_auto(self, circuit_2_entity: CircuitClimate) -> None:
         """Test target temperature shows active setpoint in auto mode."""
@@ -384,121 +317,44 @@ class TestCircuitClimate:
         # Setpoint matches comfort, so should show comfort temperature
         assert circuit_2_entity.target_temperature == 21.0
 
-    def test_hvac_action_off(self, coordinator: EconextCoordinator) -> None:
-        """Test HVAC action when circuit is off."""
-        # Set work state to 0 (off)
-        coordinator.data["286"]["value"] = 0
-
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
-
-        assert entity.hvac_action == HVACAction.OFF
-
     def test_hvac_action_heating(self, circuit_2_entity: CircuitClimate) -> None:
         """Test HVAC action when HP is heating and circuit pump is running."""
         # Fixture defaults: HPStatusCircPStat1=1 (pump on),
         # HPStatusHdwHeatStat=0 (no DHW), HPStatusWorkMode=1 (heating)
         assert circuit_2_entity.hvac_action == HVACAction.HEATING
 
-    def test_hvac_action_idle_pump_off(self, coordinator: EconextCoordinator) -> None:
-        """Test HVAC action is IDLE when circuit pump is off."""
-        coordinator.data["1354"]["value"] = 0  # HPStatusCircPStat1 = off
-
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
-
-        assert entity.hvac_action == HVACAction.IDLE
-
-    def test_hvac_action_idle_during_dhw(self, coordinator: EconextCoordinator) -> None:
-        """Test HVAC action is IDLE when DHW is loading."""
-        coordinator.data["1361"]["value"] = 1  # HPStatusHdwHeatStat = active
+    @pytest.mark.parametrize(
+        ("param_id", "value", "expected"),
+        [
+            ("286", CircuitWorkState.OFF, HVACAction.OFF),  # Circuit2WorkState = off
+            ("1354", 0, HVACAction.IDLE),  # HPStatusCircPStat1 = pump off
+            ("1361", 1, HVACAction.IDLE),  # HPStatusHdwHeatStat = DHW loading
+            ("1350", 3, HVACAction.COOLING),  # HPStatusWorkMode = cooling
+            ("1350", 0, HVACAction.IDLE),  # HPStatusWorkMode = standby
+        ],
+        ids=["circuit_off", "pump_off", "dhw_loading", "hp_cooling", "hp_standby"],
+    )
+    def test_hvac_action(
+        self,
+        coordinator: EconextCoordinator,
+        make_circuit_entity: Callable[..., CircuitClimate],
+        param_id: str,
+        value: int,
+        expected: HVACAction,
+    ) -> None:
+        """Test HVAC action when a single status param moves away from the heating default."""
+        coordinator.data[param_id]["value"] = value
 
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
-
-        assert entity.hvac_action == HVACAction.IDLE
-
-    def test_hvac_action_cooling(self, coordinator: EconextCoordinator) -> None:
-        """Test HVAC action when HP is in cooling mode."""
-        coordinator.data["1350"]["value"] = 3  # HPStatusWorkMode = cooling
+        entity = make_circuit_entity()
 
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
-
-        assert entity.hvac_action == HVACAction.COOLING
-
-    def test_hvac_action_idle_hp_standby(self, coordinator: EconextCoordinator) -> None:
-        """Test HVAC action is IDLE when HP is in standby."""
-        coordinator.data["1350"]["value"] = 0  # HPStatusWorkMode = standby
+        assert entity.hvac_action == expected
 
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
-
-        assert entity.hvac_action == HVACAction.IDLE
-
-    @pytest.mark.asyncio
     async def test_set_hvac_mode_off(self, circuit_2_entity: CircuitClimate, coordinator: EconextCoordinator) -> None:
         """Test setting HVAC mode to OFF."""
         await circuit_2_entity.async_set_hvac_mode(HVACMode.OFF)
 
         coordinator.async_set_param.assert_called_once_with("286", CircuitWorkState.OFF)
 
-    @pytest.mark.asyncio
     async def test_set_hvac_mode_heat(self, circuit_2_entity: CircuitClimate, coordinator: EconextCoordinator) -> None:
         """Test setting HVAC mode to HEAT updates heating/cooling enable bits."""
         # Circuit is already on in fixture, so should only update settings
@@ -511,22 +367,20 @@ class TestCircuitClimate:
         assert call_args[0][0] == "281"  # settings param
         # Verify heating enabled (bit 20 = 0) and cooling disabled (bit 17 = 0)
         settings_value = call_args[0][1]
-        assert ((settings_value >> 20) & 1) == 0  # Heating ON
-        assert ((settings_value >> 17) & 1) == 0  # Cooling OFF
+        assert not settings_value & SETTINGS_HEATING_DISABLED  # Heating ON
+        assert not settings_value & SETTINGS_COOLING_ENABLED  # Cooling OFF
 
     # Note: The tests for remembering presets when switching HVAC modes were removed
     # because HVAC modes (HEAT/COOL/HEAT_COOL) now only control heating/cooling enable bits,
     # not the work state. Presets (ECO/COMFORT/SCHEDULE) are controlled separately via
     # async_set_preset_mode.
 
-    @pytest.mark.asyncio
     async def test_set_preset_mode_eco(self, circuit_2_entity: CircuitClimate, coordinator: EconextCoordinator) -> None:
         """Test setting preset mode to ECO."""
         await circuit_2_entity.async_set_preset_mode(PRESET_ECO)
 
         coordinator.async_set_param.assert_called_once_with("286", CircuitWorkState.ECO)
 
-    @pytest.mark.asyncio
     async def test_set_preset_mode_comfort(
         self, circuit_2_entity: CircuitClimate, coordinator: EconextCoordinator
     ) -> None:
@@ -535,171 +389,75 @@ class TestCircuitClimate:
 
         coordinator.async_set_param.assert_called_once_with("286", CircuitWorkState.COMFORT)
 
-    @pytest.mark.asyncio
     async def test_set_preset_mode_schedule(
         self, circuit_2_entity: CircuitClimate, coordinator: EconextCoordinator
     ) -> None:
         """Test setting preset mode to SCHEDULE."""
-        from custom_components.econext.climate import PRESET_SCHEDULE
-
         await circuit_2_entity.async_set_preset_mode(PRESET_SCHEDULE)
 
         coordinator.async_set_param.assert_called_once_with("286", CircuitWorkState.AUTO)
 
-    @pytest.mark.asyncio
-    async def test_set_temperature_comfort(self, coordinator: EconextCoordinator) -> None:
+    async def test_set_temperature_comfort(
+        self, coordinator: EconextCoordinator, make_circuit_entity: Callable[..., CircuitClimate]
+    ) -> None:
         """Test setting temperature in comfort mode with HEAT only."""
         coordinator.data["286"]["value"] = CircuitWorkState.COMFORT
         # Set to HEAT mode only (heating enabled, cooling disabled)
         coordinator.data["281"]["value"] = 0  # bit 20=0 (heat on), bit 17=0 (cool off)
 
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
+        entity = make_circuit_entity()
 
         await entity.async_set_temperature(**{ATTR_TEMPERATURE: 22.5})
 
         coordinator.async_set_param.assert_called_once_with("288", 22.5)
 
-    @pytest.mark.asyncio
-    async def test_set_temperature_eco(self, coordinator: EconextCoordinator) -> None:
+    async def test_set_temperature_eco(
+        self, coordinator: EconextCoordinator, make_circuit_entity: Callable[..., CircuitClimate]
+    ) -> None:
         """Test setting temperature in eco mode with HEAT only."""
         coordinator.data["286"]["value"] = CircuitWorkState.ECO
         # Set to HEAT mode only (heating enabled, cooling disabled)
         coordinator.data["281"]["value"] = 0  # bit 20=0 (heat on), bit 17=0 (cool off)
 
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
+        entity = make_circuit_entity()
 
         await entity.async_set_temperature(**{ATTR_TEMPERATURE: 18.5})
 
         coordinator.async_set_param.assert_called_once_with("289", 18.5)
 
-    def test_preset_mode_schedule_detects_eco(self, coordinator: EconextCoordinator) -> None:
-        """Test that SCHEDULE mode updates _last_preset when setpoint matches ECO temp."""
-        from custom_components.econext.climate import PRESET_SCHEDULE
-
+    @pytest.mark.parametrize(
+        ("setpoint", "expected_preset", "expected_temperature"),
+        [
+            (19.0, PRESET_ECO, 19.0),  # Room temp setpoint matches eco
+            (22.0, PRESET_COMFORT, 22.0),  # Room temp setpoint matches comfort
+        ],
+        ids=["eco", "comfort"],
+    )
+    def test_schedule_detects_active_preset(
+        self,
+        coordinator: EconextCoordinator,
+        make_circuit_entity: Callable[..., CircuitClimate],
+        setpoint: float,
+        expected_preset: str,
+        expected_temperature: float,
+    ) -> None:
+        """Test SCHEDULE mode tracks the preset whose temperature matches the setpoint."""
         coordinator.data["286"]["value"] = CircuitWorkState.AUTO
         coordinator.data["289"]["value"] = 19.0  # Eco temp
         coordinator.data["288"]["value"] = 22.0  # Comfort temp
-        coordinator.data["92"]["value"] = 19.0  # Room temp setpoint matches eco
+        coordinator.data["92"]["value"] = setpoint
 
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
+        entity = make_circuit_entity()
 
         # Should return SCHEDULE preset
         assert entity.preset_mode == PRESET_SCHEDULE
-        # But _last_preset should be updated to ECO for temperature adjustments
-        assert entity._last_preset == PRESET_ECO
-
-    def test_preset_mode_schedule_detects_comfort(self, coordinator: EconextCoordinator) -> None:
-        """Test that SCHEDULE mode updates _last_preset when setpoint matches COMFORT temp."""
-        from custom_components.econext.climate import PRESET_SCHEDULE
-
-        coordinator.data["286"]["value"] = CircuitWorkState.AUTO
-        coordinator.data["289"]["value"] = 19.0  # Eco temp
-        coordinator.data["288"]["value"] = 22.0  # Comfort temp
-        coordinator.data["92"]["value"] = 22.0  # Room temp setpoint matches comfort
+        # But _last_preset should be updated for temperature adjustments
+        assert entity._last_preset == expected_preset
+        assert entity.target_temperature == expected_temperature
 
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
-
-        # Should return SCHEDULE preset
-        assert entity.preset_mode == PRESET_SCHEDULE
-        # But _last_preset should be updated to COMFORT for temperature adjustments
-        assert entity._last_preset == PRESET_COMFORT
-
-    def test_target_temperature_auto_shows_eco(self, coordinator: EconextCoordinator) -> None:
-        """Test target temperature in AUTO mode shows ECO temp when setpoint matches."""
-        coordinator.data["286"]["value"] = CircuitWorkState.AUTO
-        coordinator.data["289"]["value"] = 19.0  # Eco temp
-        coordinator.data["288"]["value"] = 22.0  # Comfort temp
-        coordinator.data["92"]["value"] = 19.0  # Room temp setpoint matches eco
-
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
-
-        assert entity.target_temperature == 19.0
-
-    def test_target_temperature_auto_shows_comfort(self, coordinator: EconextCoordinator) -> None:
-        """Test target temperature in AUTO mode shows COMFORT temp when setpoint matches."""
-        coordinator.data["286"]["value"] = CircuitWorkState.AUTO
-        coordinator.data["289"]["value"] = 19.0  # Eco temp
-        coordinator.data["288"]["value"] = 22.0  # Comfort temp
-        coordinator.data["92"]["value"] = 22.0  # Room temp setpoint matches comfort
-
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
-
-        assert entity.target_temperature == 22.0
-
-    @pytest.mark.asyncio
-    async def test_set_temperature_auto_mode_eco(self, coordinator: EconextCoordinator) -> None:
+    async def test_set_temperature_auto_mode_eco(
+        self, coordinator: EconextCoordinator, make_circuit_entity: Callable[..., CircuitClimate]
+    ) -> None:
         """Test setting temperature in AUTO mode when currently in ECO."""
         coordinator.data["286"]["value"] = CircuitWorkState.AUTO
         coordinator.data["289"]["value"] = 19.0  # Eco temp
@@ -708,27 +466,16 @@ class TestCircuitClimate:
         # Set to HEAT mode only (heating enabled, cooling disabled)
         coordinator.data["281"]["value"] = 0  # bit 20=0 (heat on), bit 17=0 (cool off)
 
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
+        entity = make_circuit_entity()
 
         await entity.async_set_temperature(**{ATTR_TEMPERATURE: 20.0})
 
         # Should set ECO temp (param 289)
         coordinator.async_set_param.assert_called_once_with("289", 20.0)
 
-    @pytest.mark.asyncio
-    async def test_set_temperature_auto_mode_comfort(self, coordinator: EconextCoordinator) -> None:
+    async def test_set_temperature_auto_mode_comfort(
+        self, coordinator: EconextCoordinator, make_circuit_entity: Callable[..., CircuitClimate]
+    ) -> None:
         """Test setting temperature in AUTO mode when currently in COMFORT."""
         coordinator.data["286"]["value"] = CircuitWorkState.AUTO
         coordinator.data["289"]["value"] = 19.0  # Eco temp
@@ -737,30 +484,13 @@ class TestCircuitClimate:
         # Set to HEAT mode only (heating enabled, cooling disabled)
         coordinator.data["281"]["value"] = 0  # bit 20=0 (heat on), bit 17=0 (cool off)
 
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
+        entity = make_circuit_entity()
 
         await entity.async_set_temperature(**{ATTR_TEMPERATURE: 23.0})
 
         # Should set COMFORT temp (param 288)
         coordinator.async_set_param.assert_called_once_with("288", 23.0)
 
-    def test_unique_id(self, circuit_2_entity: CircuitClimate) -> None:
-        """Test climate entity unique_id generation."""
-        # UID from fixture is "2L7SDPN6KQ38CIH2401K01U", device_id is "circuit_2", work_state_param is "286"
-        assert circuit_2_entity._attr_unique_id == "2L7SDPN6KQ38CIH2401K01U_circuit_2_286"
-
     def test_device_info(self, circuit_2_entity: CircuitClimate) -> None:
         """Test climate entity device info."""
         device_info = circuit_2_entity.device_info
@@ -777,67 +507,49 @@ class TestCircuitClimate:
 class TestOperatingModeHVACModes:
     """Test HVAC modes based on operating mode and circuit settings."""
 
-    def test_hvac_modes_cooling_support_enabled(self, coordinator: EconextCoordinator) -> None:
-        """Test HVAC modes include COOL when cooling_support (param 485) is enabled."""
-        coordinator.data["485"]["value"] = 1
-
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
-
-        modes = entity.hvac_modes
-        assert modes == [HVACMode.OFF, HVACMode.AUTO, HVACMode.HEAT, HVACMode.COOL]
-
-    def test_hvac_modes_cooling_support_disabled(self, coordinator: EconextCoordinator) -> None:
-        """Test HVAC modes exclude COOL when cooling_support (param 485) is disabled."""
-        coordinator.data["485"]["value"] = 0
-
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
-
-        modes = entity.hvac_modes
-        assert modes == [HVACMode.OFF, HVACMode.AUTO, HVACMode.HEAT]
-        assert HVACMode.COOL not in modes
-
-    def test_hvac_modes_cooling_support_missing(self, coordinator: EconextCoordinator) -> None:
-        """Test HVAC modes default to no COOL when cooling_support param is missing."""
-        del coordinator.data["485"]
+    @pytest.mark.parametrize(
+        ("cooling_support", "expected"),
+        [
+            (1, [HVACMode.OFF, HVACMode.AUTO, HVACMode.HEAT, HVACMode.COOL]),
+            (0, [HVACMode.OFF, HVACMode.AUTO, HVACMode.HEAT]),
+            (None, [HVACMode.OFF, HVACMode.AUTO, HVACMode.HEAT]),  # Param missing
+        ],
+        ids=["enabled", "disabled", "missing"],
+    )
+    def test_hvac_modes_cooling_support(
+        self,
+        coordinator: EconextCoordinator,
+        circuit_2_entity: CircuitClimate,
+        cooling_support: int | None,
+        expected: list[HVACMode],
+    ) -> None:
+        """Test HVAC modes only include COOL when cooling_support (param 485) is enabled."""
+        if cooling_support is None:
+            del coordinator.data["485"]
+        else:
+            coordinator.data["485"]["value"] = cooling_support
+
+        assert circuit_2_entity.hvac_modes == expected
+
+    @pytest.mark.parametrize(
+        ("settings", "expected"),
+        [
+            (0, HVACMode.HEAT),
+            (SETTINGS_COOLING_ENABLED, HVACMode.AUTO),
+            (SETTINGS_HEATING_DISABLED | SETTINGS_COOLING_ENABLED, HVACMode.COOL),
+            (SETTINGS_HEATING_DISABLED, HVACMode.HEAT),  # Both disabled falls back to HEAT
+        ],
+        ids=["heat_only", "heat_and_cool", "cool_only", "neither"],
+    )
+    def test_hvac_mode_from_settings_bits(
+        self,
+        coordinator: EconextCoordinator,
+        circuit_2_entity: CircuitClimate,
+        settings: int,
+        expected: HVACMode,
+    ) -> None:
+        """Test every heating/cooling enable combination maps to the right HVAC mode."""
+        coordinator.data["286"]["value"] = CircuitWorkState.COMFORT
+        coordinator.data["281"]["value"] = settings
 
-        circuit = CIRCUITS[2]
-        entity = CircuitClimate(
-            coordinator,
-            circuit_num=2,
-            name_param=circuit.name_param,
-            work_state_param=circuit.work_state_param,
-            settings_param=circuit.settings_param,
-            thermostat_param=circuit.thermostat_param,
-            comfort_param=circuit.comfort_param,
-            eco_param=circuit.eco_param,
-            room_temp_setpoint_param=circuit.room_temp_setpoint_param,
-            boost_time_left_param=circuit.boost_time_left_param,
-        )
-
-        modes = entity.hvac_modes
-        assert modes == [HVACMode.OFF, HVACMode.AUTO, HVACMode.HEAT]
-        assert HVACMode.COOL not in modes
+        assert circuit_2_entity.hvac_mode == expected
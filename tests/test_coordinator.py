@@ -1,11 +1,13 @@
 """Tests for the econext data coordinator."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import copy
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from custom_components.econext.api import EconextApiError, EconextApi
+from custom_components.econext.climate import CIRCUITS
 from custom_components.econext.coordinator import EconextCoordinator
 
 
@@ -23,11 +25,14 @@ def mock_api() -> MagicMock:
     return MagicMock(spec=EconextApi)
 
 
-@pytest.fixture(autouse=True)
-def patch_frame_helper():
-    """Patch Home Assistant frame helper for all tests."""
-    with patch("homeassistant.helpers.frame.report_usage"):
-        yield
+@pytest.fixture(scope="module")
+def read_only_coordinator(_all_params_source: dict) -> EconextCoordinator:
+    """Create one coordinator over the shared fixture data for lookup tests that never mutate it."""
+    hass = MagicMock()
+    hass.loop = AsyncMock()
+    coordinator = EconextCoordinator(hass, MagicMock(spec=EconextApi))
+    coordinator.data = _all_params_source
+    return coordinator
 
 
 class TestCoordinatorInit:
@@ -45,7 +50,6 @@ class TestCoordinatorInit:
 class TestAsyncUpdateData:
     """Test the _async_update_data method."""
 
-    @pytest.mark.asyncio
     async def test_update_data_success(
         self,
         mock_hass: MagicMock,
@@ -61,7 +65,6 @@ class TestAsyncUpdateData:
         assert result == all_params_parsed
         mock_api.async_fetch_all_params.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_update_data_api_error(self, mock_hass: MagicMock, mock_api: MagicMock) -> None:
         """Test that API errors are wrapped in UpdateFailed."""
         mock_api.async_fetch_all_params = AsyncMock(side_effect=EconextApiError("Connection failed"))
@@ -75,127 +78,230 @@ class TestAsyncUpdateData:
 class TestGetParam:
     """Test the get_param method."""
 
-    def test_get_param_exists(
+    @pytest.mark.parametrize(
+        ("param_id", "expected_name"),
+        [("10", "UID"), (10, "UID"), ("99999", None)],
+        ids=["str_id", "int_id", "missing"],
+    )
+    def test_get_param(
+        self, read_only_coordinator: EconextCoordinator, param_id: str | int, expected_name: str | None
+    ) -> None:
+        """Test getting a parameter by string or int ID."""
+        param = read_only_coordinator.get_param(param_id)
+
+        if expected_name is None:
+            assert param is None
+        else:
+            assert param["name"] == expected_name
+
+    def test_get_param_no_data(self, mock_hass: MagicMock, mock_api: MagicMock) -> None:
+        """Test getting a parameter when data is None."""
+        coordinator = EconextCoordinator(mock_hass, mock_api)
+        coordinator.data = None
+
+        param = coordinator.get_param("10")
+        assert param is None
+
+
+class TestParams:
+    """Test the params property."""
+
+    def test_params_returns_data(
         self,
         mock_hass: MagicMock,
         mock_api: MagicMock,
         all_params_parsed: dict,
     ) -> None:
-        """Test getting an existing parameter."""
+        """Test params exposes the current parameter data."""
         coordinator = EconextCoordinator(mock_hass, mock_api)
         coordinator.data = all_params_parsed
 
-        # Test with string ID
-        param = coordinator.get_param("10")
-        assert param is not None
-        assert param["name"] == "UID"
+        assert coordinator.params is all_params_parsed
+        assert coordinator.params.get("10")["name"] == "UID"
+
+    def test_params_no_data(self, mock_hass: MagicMock, mock_api: MagicMock) -> None:
+        """Test params is empty when data is None."""
+        coordinator = EconextCoordinator(mock_hass, mock_api)
+        coordinator.data = None
+
+        assert coordinator.params == {}
 
-        # Test with int ID
-        param = coordinator.get_param(10)
-        assert param is not None
-        assert param["name"] == "UID"
 
-    def test_get_param_not_exists(
+class TestDhwAvailable:
+    """Test the dhw_available property."""
+
+    def test_dhw_available_from_fixture(
         self,
         mock_hass: MagicMock,
         mock_api: MagicMock,
         all_params_parsed: dict,
     ) -> None:
-        """Test getting a non-existent parameter."""
+        """Test DHW is available when TempCWU has a real reading."""
         coordinator = EconextCoordinator(mock_hass, mock_api)
         coordinator.data = all_params_parsed
 
-        param = coordinator.get_param("99999")
-        assert param is None
+        assert coordinator.dhw_available is True
 
-    def test_get_param_no_data(self, mock_hass: MagicMock, mock_api: MagicMock) -> None:
-        """Test getting a parameter when data is None."""
+    def test_dhw_unavailable_when_disconnected(
+        self,
+        mock_hass: MagicMock,
+        mock_api: MagicMock,
+        all_params_parsed: dict,
+    ) -> None:
+        """Test the 999.0 disconnected sentinel marks DHW as unavailable."""
+        coordinator = EconextCoordinator(mock_hass, mock_api)
+        coordinator.data = all_params_parsed
+        coordinator.data["61"]["value"] = 999.0
+
+        assert coordinator.dhw_available is False
+
+    def test_dhw_unavailable_no_data(self, mock_hass: MagicMock, mock_api: MagicMock) -> None:
+        """Test DHW is unavailable when data is None."""
         coordinator = EconextCoordinator(mock_hass, mock_api)
         coordinator.data = None
 
-        param = coordinator.get_param("10")
-        assert param is None
+        assert coordinator.dhw_available is False
 
 
-class TestGetParamValue:
-    """Test the get_param_value method."""
+class TestGetActiveCircuits:
+    """Test the get_active_circuits method."""
 
-    def test_get_param_value_exists(
+    def test_get_active_circuits_from_fixture(
         self,
         mock_hass: MagicMock,
         mock_api: MagicMock,
         all_params_parsed: dict,
     ) -> None:
-        """Test getting a parameter value."""
+        """Test only circuits with a non-zero active param are returned."""
         coordinator = EconextCoordinator(mock_hass, mock_api)
         coordinator.data = all_params_parsed
 
-        # UID parameter (id 10)
-        value = coordinator.get_param_value(10)
-        assert value == "2L7SDPN6KQ38CIH2401K01U"
+        active = coordinator.get_active_circuits(CIRCUITS)
 
-        # Device name (id 374)
-        value = coordinator.get_param_value(374)
-        assert value == "ecoMAX360i"
+        # Only Circuit 2 is active in fixture
+        assert active == ((2, CIRCUITS[2]),)
 
-    def test_get_param_value_not_exists(
+    def test_get_active_circuits_cached_per_snapshot(
         self,
         mock_hass: MagicMock,
         mock_api: MagicMock,
         all_params_parsed: dict,
     ) -> None:
-        """Test getting a non-existent parameter value."""
+        """Test the scan is reused until the data snapshot changes."""
         coordinator = EconextCoordinator(mock_hass, mock_api)
         coordinator.data = all_params_parsed
 
-        value = coordinator.get_param_value("99999")
-        assert value is None
+        first = coordinator.get_active_circuits(CIRCUITS)
+        assert coordinator.get_active_circuits(CIRCUITS) is first
 
-    def test_get_param_value_no_data(self, mock_hass: MagicMock, mock_api: MagicMock) -> None:
-        """Test getting a parameter value when data is None."""
-        coordinator = EconextCoordinator(mock_hass, mock_api)
-        coordinator.data = None
+        new_data = copy.deepcopy(all_params_parsed)
+        new_data["279"]["value"] = 1
+        coordinator.data = new_data
 
-        value = coordinator.get_param_value(10)
-        assert value is None
+        circuit_nums = {num for num, _ in coordinator.get_active_circuits(CIRCUITS)}
+        assert circuit_nums == {1, 2}
 
+    def test_get_active_circuits_keyed_on_mapping(
+        self,
+        mock_hass: MagicMock,
+        mock_api: MagicMock,
+        all_params_parsed: dict,
+    ) -> None:
+        """Test a different circuits mapping for the same snapshot is scanned, not served from cache."""
+        coordinator = EconextCoordinator(mock_hass, mock_api)
+        coordinator.data = all_params_parsed
 
-class TestDeviceInfo:
-    """Test device info helper methods."""
+        assert coordinator.get_active_circuits(CIRCUITS) == ((2, CIRCUITS[2]),)
+        assert coordinator.get_active_circuits({1: CIRCUITS[1]}) == ()
+        assert coordinator.get_active_circuits({2: CIRCUITS[2]}) == ((2, CIRCUITS[2]),)
 
-    def test_get_device_uid(
+    async def test_get_active_circuits_sees_local_param_write(
         self,
         mock_hass: MagicMock,
         mock_api: MagicMock,
         all_params_parsed: dict,
     ) -> None:
-        """Test getting device UID."""
+        """Test a successful async_set_param invalidates the cache despite the in-place update."""
+        mock_api.async_set_param = AsyncMock(return_value=True)
         coordinator = EconextCoordinator(mock_hass, mock_api)
         coordinator.data = all_params_parsed
+        coordinator.async_set_updated_data = MagicMock()
 
-        uid = coordinator.get_device_uid()
-        assert uid == "2L7SDPN6KQ38CIH2401K01U"
+        assert coordinator.get_active_circuits(CIRCUITS) == ((2, CIRCUITS[2]),)
 
-    def test_get_device_uid_no_data(self, mock_hass: MagicMock, mock_api: MagicMock) -> None:
-        """Test getting device UID when data is unavailable."""
-        coordinator = EconextCoordinator(mock_hass, mock_api)
-        coordinator.data = None
+        # Activate Circuit 1 (Circuit1active)
+        await coordinator.async_set_param("279", 1)
 
-        uid = coordinator.get_device_uid()
-        assert uid == "unknown"
+        circuit_nums = {num for num, _ in coordinator.get_active_circuits(CIRCUITS)}
+        assert circuit_nums == {1, 2}
 
-    def test_get_device_name(
+    def test_is_circuit_active_none_value(
         self,
         mock_hass: MagicMock,
         mock_api: MagicMock,
         all_params_parsed: dict,
     ) -> None:
-        """Test getting device name."""
+        """Test a None active value is treated as inactive instead of raising."""
         coordinator = EconextCoordinator(mock_hass, mock_api)
         coordinator.data = all_params_parsed
+        coordinator.data["329"]["value"] = None
 
-        name = coordinator.get_device_name()
-        assert name == "ecoMAX360i"
+        assert coordinator.is_circuit_active(CIRCUITS[2]) is False
+        assert coordinator.get_active_circuits(CIRCUITS) == ()
+
+    def test_get_active_circuits_no_data(self, mock_hass: MagicMock, mock_api: MagicMock) -> None:
+        """Test no circuits are active when data is None."""
+        coordinator = EconextCoordinator(mock_hass, mock_api)
+        coordinator.data = None
+
+        assert coordinator.get_active_circuits(CIRCUITS) == ()
+
+
+class TestGetParamValue:
+    """Test the get_param_value method."""
+
+    @pytest.mark.parametrize(
+        ("param_id", "expected"),
+        [
+            (10, "2L7SDPN6KQ38CIH2401K01U"),  # UID
+            (374, "ecoMAX360i"),  # Device name
+            ("99999", None),
+        ],
+        ids=["uid", "device_name", "missing"],
+    )
+    def test_get_param_value(
+        self, read_only_coordinator: EconextCoordinator, param_id: str | int, expected: str | None
+    ) -> None:
+        """Test getting a parameter value."""
+        assert read_only_coordinator.get_param_value(param_id) == expected
+
+    def test_get_param_value_no_data(self, mock_hass: MagicMock, mock_api: MagicMock) -> None:
+        """Test getting a parameter value when data is None."""
+        coordinator = EconextCoordinator(mock_hass, mock_api)
+        coordinator.data = None
+
+        value = coordinator.get_param_value(10)
+        assert value is None
+
+
+class TestDeviceInfo:
+    """Test device info helper methods."""
+
+    def test_get_device_uid(self, read_only_coordinator: EconextCoordinator) -> None:
+        """Test getting device UID."""
+        assert read_only_coordinator.get_device_uid() == "2L7SDPN6KQ38CIH2401K01U"
+
+    def test_get_device_uid_no_data(self, mock_hass: MagicMock, mock_api: MagicMock) -> None:
+        """Test getting device UID when data is unavailable."""
+        coordinator = EconextCoordinator(mock_hass, mock_api)
+        coordinator.data = None
+
+        uid = coordinator.get_device_uid()
+        assert uid == "unknown"
+
+    def test_get_device_name(self, read_only_coordinator: EconextCoordinator) -> None:
+        """Test getting device name."""
+        assert read_only_coordinator.get_device_name() == "ecoMAX360i"
 
     def test_get_device_name_no_data(self, mock_hass: MagicMock, mock_api: MagicMock) -> None:
         """Test getting device name when data is unavailable."""
@@ -1,6 +1,6 @@
 """Tests for heat pump entities."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -17,13 +17,6 @@ from custom_components.econext.select import EconextSelect
 from custom_components.econext.sensor import EconextSensor
 
 
-@pytest.fixture(autouse=True)
-def patch_frame_helper():
-    """Patch Home Assistant frame helper for all tests."""
-    with patch("homeassistant.helpers.frame.report_usage"):
-        yield
-
-
 @pytest.fixture
 def mock_hass() -> MagicMock:
     """Create a mock Home Assistant instance."""
@@ -469,7 +462,6 @@ class TestHeatPumpNumbers:
         assert number.native_value == 550
         assert number.native_unit_of_measurement == "RPM"
 
-    @pytest.mark.asyncio
     async def test_set_purge_pwm_speed(self, coordinator):
         """Test setting purge PWM speed."""
         number_desc = next(n for n in HEATPUMP_NUMBERS if n.key == "purge_pwm_speed")
@@ -478,7 +470,6 @@ class TestHeatPumpNumbers:
         await number.async_set_native_value(75)
         coordinator.async_set_param.assert_called_once_with("1370", 75)
 
-    @pytest.mark.asyncio
     async def test_set_fan_speed_0(self, coordinator):
         """Test setting fan speed 0."""
         number_desc = next(n for n in HEATPUMP_NUMBERS if n.key == "fan_speed_0")
@@ -532,7 +523,6 @@ class TestHeatPumpSelects:
         assert "off" in select.options
         assert "schedule" in select.options
 
-    @pytest.mark.asyncio
     async def test_set_work_mode(self, coordinator):
         """Test setting work mode."""
         select_desc = next(s for s in HEATPUMP_SELECTS if s.key == "work_mode")
@@ -541,7 +531,6 @@ class TestHeatPumpSelects:
         await select.async_select_option("on")
         coordinator.async_set_param.assert_called_once_with("1133", 1)
 
-    @pytest.mark.asyncio
     async def test_set_silent_mode_level(self, coordinator):
         """Test setting silent mode level."""
         select_desc = next(s for s in HEATPUMP_SELECTS if s.key == "silent_mode_level")
@@ -569,7 +558,6 @@ class TestHeatPumpButtons:
         assert button.unique_id == "2L7SDPN6KQ38CIH2401K01U_heatpump_1369"
         assert button.entity_category == "config"
 
-    @pytest.mark.asyncio
     async def test_press_reboot_button(self, coordinator):
         """Test pressing reboot button."""
         button_desc = next(b for b in HEATPUMP_BUTTONS if b.key == "reboot")
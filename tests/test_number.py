@@ -1,6 +1,6 @@
 """Tests for the econext number platform."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from homeassistant.const import UnitOfTemperature
@@ -10,13 +10,6 @@ from custom_components.econext.coordinator import EconextCoordinator
 from custom_components.econext.number import EconextNumber
 
 
-@pytest.fixture(autouse=True)
-def patch_frame_helper():
-    """Patch Home Assistant frame helper for all tests."""
-    with patch("homeassistant.helpers.frame.report_usage"):
-        yield
-
-
 @pytest.fixture
 def mock_hass() -> MagicMock:
     """Create a mock Home Assistant instance."""
@@ -140,7 +133,6 @@ class TestAntiCyclingNumbers:
         assert number.native_min_value == 0
         assert number.native_max_value == 100
 
-    @pytest.mark.asyncio
     async def test_set_min_work_time(self, coordinator: EconextCoordinator) -> None:
         """Test setting min work time value."""
         desc = next(n for n in CONTROLLER_NUMBERS if n.key == "min_work_time")
@@ -149,7 +141,6 @@ class TestAntiCyclingNumbers:
         await number.async_set_native_value(10.0)
         coordinator.async_set_param.assert_called_once_with("498", 10)
 
-    @pytest.mark.asyncio
     async def test_set_min_break_time(self, coordinator: EconextCoordinator) -> None:
         """Test setting min break time value."""
         desc = next(n for n in CONTROLLER_NUMBERS if n.key == "min_break_time")
@@ -238,6 +229,21 @@ class TestEconextNumber:
         # From fixture: param 703 has maxvDP=702, param 702 value=24
         assert number.native_max_value == 24.0
 
+    def test_number_dynamic_min_tracks_referenced_param(self, coordinator: EconextCoordinator) -> None:
+        """Test dynamic min follows the referenced param value after entity creation."""
+        description = EconextNumberEntityDescription(
+            key="summer_mode_on",
+            param_id="702",
+            native_min_value=999,
+            native_max_value=999,
+        )
+
+        number = EconextNumber(coordinator, description)
+        # Param 702 has minvDP=703 - the referenced value changes on a later poll
+        coordinator.data["703"]["value"] = 18
+
+        assert number.native_min_value == 18.0
+
     def test_number_fallback_when_no_allparams(self, coordinator: EconextCoordinator) -> None:
         """Test number falls back to description limits when param not in allParams."""
         description = EconextNumberEntityDescription(
@@ -253,7 +259,6 @@ class TestEconextNumber:
         assert number.native_min_value == 15
         assert number.native_max_value == 30
 
-    @pytest.mark.asyncio
     async def test_set_native_value(self, coordinator: EconextCoordinator) -> None:
         """Test setting a number value."""
         description = EconextNumberEntityDescription(
@@ -269,6 +274,37 @@ class TestEconextNumber:
         coordinator.async_set_param.assert_called_once_with("702", 25)
 
 
+    async def test_set_native_value_below_min_rejected(self, coordinator: EconextCoordinator) -> None:
+        """Test values below the minimum are not sent to the device."""
+        description = EconextNumberEntityDescription(
+            key="summer_mode_on",
+            param_id="702",
+            native_min_value=22,
+            native_max_value=30,
+        )
+
+        number = EconextNumber(coordinator, description)
+        # Param 702 min comes from param 703 (value=22)
+        await number.async_set_native_value(10.0)
+
+        coordinator.async_set_param.assert_not_called()
+
+    async def test_set_native_value_unchanged_skipped(self, coordinator: EconextCoordinator) -> None:
+        """Test setting the current value does not call the device."""
+        description = EconextNumberEntityDescription(
+            key="summer_mode_on",
+            param_id="702",
+            native_min_value=22,
+            native_max_value=30,
+        )
+
+        number = EconextNumber(coordinator, description)
+        # From fixture, param 702 (SummerOn) = 24
+        await number.async_set_native_value(24.0)
+
+        coordinator.async_set_param.assert_not_called()
+
+
 class TestCircuitNumbers:
     """Test circuit number functionality."""
 
@@ -300,6 +336,23 @@ class TestCircuitNumbers:
         for number in CIRCUIT_NUMBERS:
             assert number.device_type == DeviceType.CIRCUIT
 
+    def test_circuit_param_id_mapping(self, coordinator: EconextCoordinator) -> None:
+        """Test circuit number keys resolve to the circuit's parameter IDs."""
+        from custom_components.econext.climate import CIRCUITS
+        from custom_components.econext.number import _get_circuit_param_id, _get_circuit_schedule_param_id
+
+        circuit = CIRCUITS[2]
+
+        assert _get_circuit_param_id(circuit, "comfort_temp") == "288"
+        assert _get_circuit_param_id(circuit, "cooling_fixed_temp") == "789"
+        # Circuit 2 is UFH (type=2) in fixture, so heating curve uses the floor curve
+        assert _get_circuit_param_id(circuit, "heating_curve", coordinator) == "324"
+        assert _get_circuit_param_id(circuit, "unknown_key") is None
+
+        assert _get_circuit_schedule_param_id(circuit, "schedule_sunday_am") == "297"
+        assert _get_circuit_schedule_param_id(circuit, "schedule_saturday_pm") == "310"
+        assert _get_circuit_schedule_param_id(circuit, "schedule_someday_am") is None
+
     def test_circuit_comfort_temp_number(self, coordinator: EconextCoordinator) -> None:
         """Test circuit comfort temperature number."""
         description = EconextNumberEntityDescription(
@@ -416,7 +469,6 @@ class TestCircuitNumbers:
         # From fixture, param 325 = 5
         assert number.native_value == 5.0
 
-    @pytest.mark.asyncio
     async def test_circuit_set_comfort_temp(self, coordinator: EconextCoordinator) -> None:
         """Test setting circuit comfort temperature."""
         description = EconextNumberEntityDescription(
@@ -433,7 +485,6 @@ class TestCircuitNumbers:
 
         coordinator.async_set_param.assert_called_once_with("288", 22.5)
 
-    @pytest.mark.asyncio
     async def test_circuit_set_eco_temp(self, coordinator: EconextCoordinator) -> None:
         """Test setting circuit eco temperature."""
         description = EconextNumberEntityDescription(
@@ -528,7 +579,6 @@ class TestCircuitNumbers:
         assert number.native_max_value == 25.0  # From allParams maxv
         assert number._attr_icon == "mdi:snowflake"
 
-    @pytest.mark.asyncio
     async def test_set_cooling_setpoint(self, coordinator: EconextCoordinator) -> None:
         """Test setting circuit cooling setpoint."""
         description = EconextNumberEntityDescription(
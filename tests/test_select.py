@@ -1,6 +1,6 @@
 """Tests for the econext select platform."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -15,13 +15,6 @@ from custom_components.econext.coordinator import EconextCoordinator
 from custom_components.econext.select import EconextSelect
 
 
-@pytest.fixture(autouse=True)
-def patch_frame_helper():
-    """Patch Home Assistant frame helper for all tests."""
-    with patch("homeassistant.helpers.frame.report_usage"):
-        yield
-
-
 @pytest.fixture
 def mock_hass() -> MagicMock:
     """Create a mock Home Assistant instance."""
@@ -206,7 +199,6 @@ class TestEconextSelect:
         select = EconextSelect(coordinator, description)
         assert select.current_option is None
 
-    @pytest.mark.asyncio
     async def test_select_option_winter(self, coordinator: EconextCoordinator) -> None:
         """Test setting select to winter."""
         description = EconextSelectEntityDescription(
@@ -222,7 +214,6 @@ class TestEconextSelect:
 
         coordinator.async_set_param.assert_called_once_with("162", 2)
 
-    @pytest.mark.asyncio
     async def test_select_option_summer(self, coordinator: EconextCoordinator) -> None:
         """Test setting select to summer."""
         description = EconextSelectEntityDescription(
@@ -238,7 +229,6 @@ class TestEconextSelect:
 
         coordinator.async_set_param.assert_called_once_with("162", 1)
 
-    @pytest.mark.asyncio
     async def test_select_option_auto(self, coordinator: EconextCoordinator) -> None:
         """Test setting select to auto."""
         description = EconextSelectEntityDescription(
@@ -254,7 +244,6 @@ class TestEconextSelect:
 
         coordinator.async_set_param.assert_called_once_with("162", 6)
 
-    @pytest.mark.asyncio
     async def test_select_option_unknown(self, coordinator: EconextCoordinator) -> None:
         """Test setting select to unknown option does nothing."""
         description = EconextSelectEntityDescription(
@@ -333,7 +322,6 @@ class TestCircuitTypeSelect:
         # From fixture, param 319 = 2 (UFH)
         assert select.current_option == "ufh"
 
-    @pytest.mark.asyncio
     async def test_set_circuit_type(self, coordinator: EconextCoordinator) -> None:
         """Test setting circuit type."""
         from custom_components.econext.const import CIRCUIT_TYPE_MAPPING, CIRCUIT_TYPE_OPTIONS, CIRCUIT_TYPE_REVERSE
@@ -1,6 +1,6 @@
 """Tests for the econext sensor platform."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
@@ -11,13 +11,6 @@ from custom_components.econext.coordinator import EconextCoordinator
 from custom_components.econext.sensor import EconextSensor
 
 
-@pytest.fixture(autouse=True)
-def patch_frame_helper():
-    """Patch Home Assistant frame helper for all tests."""
-    with patch("homeassistant.helpers.frame.report_usage"):
-        yield
-
-
 @pytest.fixture
 def mock_hass() -> MagicMock:
     """Create a mock Home Assistant instance."""
@@ -157,6 +150,18 @@ class TestEconextSensor:
         # From fixture, param 0 (PS) = "S024.25"
         assert value == "S024.25"
 
+    def test_sensor_string_value_with_precision(self, coordinator: EconextCoordinator) -> None:
+        """Test precision is ignored for non-numeric values."""
+        description = EconextSensorEntityDescription(
+            key="software_version",
+            param_id="0",
+            precision=1,
+        )
+
+        sensor = EconextSensor(coordinator, description)
+
+        assert sensor.native_value == "S024.25"
+
     def test_sensor_device_info_controller(self, coordinator: EconextCoordinator) -> None:
         """Test sensor device info for controller."""
         description = EconextSensorEntityDescription(
@@ -310,6 +315,23 @@ class TestEnumSensor:
         assert sensor.native_value == "unknown"
         assert "unknown" in sensor._attr_options
 
+    def test_enum_sensor_non_numeric_value_returns_unknown(self, coordinator: EconextCoordinator) -> None:
+        """Test enum sensor returns 'unknown' instead of raising for a non-numeric value."""
+        from custom_components.econext.const import HP_STATUS_WORK_MODE_MAPPING, HP_STATUS_WORK_MODE_OPTIONS
+
+        coordinator.data["1350"] = {"value": "n/a", "name": "HPStatusWorkMode", "info": 23}
+
+        description = EconextSensorEntityDescription(
+            key="hp_status_work_mode",
+            param_id="1350",
+            device_class=SensorDeviceClass.ENUM,
+            options=HP_STATUS_WORK_MODE_OPTIONS,
+            value_map=HP_STATUS_WORK_MODE_MAPPING,
+        )
+
+        sensor = EconextSensor(coordinator, description)
+        assert sensor.native_value == "unknown"
+
     def test_current_season_summer_manual(self, coordinator: EconextCoordinator) -> None:
         """current_season decodes raw 1 (manual summer) to 'summer'."""
         from custom_components.econext.const import CURRENT_SEASON_OPTIONS, decode_current_season
@@ -572,6 +594,26 @@ class TestCircuitSensors:
         # Unique ID should include circuit device_id
         assert "circuit_2" in sensor.unique_id
 
+    def test_circuit_param_id_mapping(self) -> None:
+        """Test circuit sensor keys resolve to the circuit's parameter IDs."""
+        from custom_components.econext.climate import CIRCUITS
+        from custom_components.econext.sensor import (
+            _get_circuit_param_id,
+            _get_circuit_schedule_diagnostic_params,
+        )
+
+        circuit = CIRCUITS[2]
+
+        assert _get_circuit_param_id(circuit, "thermostat_temp") == "327"
+        assert _get_circuit_param_id(circuit, "calc_temp") == "287"
+        assert _get_circuit_param_id(circuit, "room_temp_setpoint") == "92"
+        assert _get_circuit_param_id(circuit, "active_preset_mode") == "289"
+        assert _get_circuit_param_id(circuit, "boost_time_remaining") == "1433"
+        assert _get_circuit_param_id(circuit, "unknown_key") is None
+
+        assert _get_circuit_schedule_diagnostic_params(circuit, "schedule_monday_decoded") == ("299", "300")
+        assert _get_circuit_schedule_diagnostic_params(circuit, "schedule_someday_decoded") == (None, None)
+
 
 class TestScheduleBitfieldDecoder:
     """Test the decode_schedule_bitfield function."""
@@ -700,6 +742,17 @@ class TestScheduleBitfieldDecoder:
         result = decode_schedule_bitfield(1047552, is_am=False)
         assert result == "17:00-22:00"
 
+    def test_decode_is_cached(self) -> None:
+        """Test repeated decodes of the same bitfield are served from cache."""
+        from custom_components.econext.sensor import decode_schedule_bitfield
+
+        decode_schedule_bitfield.cache_clear()
+        first = decode_schedule_bitfield(1792, is_am=True)
+        second = decode_schedule_bitfield(1792, is_am=True)
+
+        assert first == second == "04:00-05:30"
+        assert decode_schedule_bitfield.cache_info().hits == 1
+
 
 class TestScheduleDiagnosticSensor:
     """Test the EconextScheduleDiagnosticSensor class (combines AM+PM)."""
@@ -868,3 +921,54 @@ class TestScheduleDiagnosticSensor:
 
         sensor = EconextScheduleDiagnosticSensor(coordinator, description)
         assert sensor.native_value == "00:00-12:00, 12:00-24:00"
+
+
+class TestAlarmSensor:
+    """Test the EconextAlarmSensor class."""
+
+    def test_alarm_history_attributes(self, coordinator: EconextCoordinator) -> None:
+        """Test alarm history is exposed in the attributes."""
+        from custom_components.econext.sensor import EconextAlarmSensor
+
+        coordinator._alarms = [
+            {"code": 148, "from_date": "2026-01-15 10:00:00", "to_date": None},
+        ]
+
+        sensor = EconextAlarmSensor(coordinator)
+        attrs = sensor.extra_state_attributes
+
+        assert attrs["active_alarm_count"] == 1
+        assert attrs["alarm_code"] == 148
+        assert attrs["alarm_history"] == [
+            {
+                "code": 148,
+                "name": "Water flow failure",
+                "from_date": "2026-01-15 10:00:00",
+                "to_date": None,
+            }
+        ]
+
+    def test_alarm_history_reused_when_unchanged(self, coordinator: EconextCoordinator) -> None:
+        """Test alarm history is only rebuilt when the alarms change."""
+        from custom_components.econext.sensor import EconextAlarmSensor
+
+        coordinator._alarms = [
+            {"code": 148, "from_date": "2026-01-15 10:00:00", "to_date": None},
+        ]
+
+        sensor = EconextAlarmSensor(coordinator)
+        first = sensor.extra_state_attributes["alarm_history"]
+
+        # Same alarms fetched again (new list, equal content)
+        coordinator._alarms = [
+            {"code": 148, "from_date": "2026-01-15 10:00:00", "to_date": None},
+        ]
+        assert sensor.extra_state_attributes["alarm_history"] is first
+
+        # Alarm resolved - history must be rebuilt
+        coordinator._alarms = [
+            {"code": 148, "from_date": "2026-01-15 10:00:00", "to_date": "2026-01-15 12:00:00"},
+        ]
+        history = sensor.extra_state_attributes["alarm_history"]
+        assert history is not first
+        assert history[0]["to_date"] == "2026-01-15 12:00:00"
@@ -1,6 +1,6 @@
 """Tests for the econext switch platform."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -9,13 +9,6 @@ from custom_components.econext.coordinator import EconextCoordinator
 from custom_components.econext.switch import EconextSwitch
 
 
-@pytest.fixture(autouse=True)
-def patch_frame_helper():
-    """Patch Home Assistant frame helper for all tests."""
-    with patch("homeassistant.helpers.frame.report_usage"):
-        yield
-
-
 @pytest.fixture
 def mock_hass() -> MagicMock:
     """Create a mock Home Assistant instance."""
@@ -121,7 +114,6 @@ class TestEconextSwitch:
         switch = EconextSwitch(coordinator, description)
         assert switch.is_on is None
 
-    @pytest.mark.asyncio
     async def test_turn_on(self, coordinator: EconextCoordinator) -> None:
         """Test turning switch on."""
         description = EconextSwitchEntityDescription(
@@ -134,7 +126,6 @@ class TestEconextSwitch:
 
         coordinator.async_set_param.assert_called_once_with("485", 1)
 
-    @pytest.mark.asyncio
     async def test_turn_off(self, coordinator: EconextCoordinator) -> None:
         """Test turning switch off."""
         description = EconextSwitchEntityDescription(
@@ -256,7 +247,6 @@ class TestBitfieldSwitches:
         switch = EconextSwitch(coordinator, description)
         assert switch.is_on is False
 
-    @pytest.mark.asyncio
     async def test_bitfield_turn_on_sets_bit(self, coordinator: EconextCoordinator) -> None:
         """Test turning on a bitfield switch sets the correct bit."""
         # Start with bits 13 and 17 set (8192 + 131072 = 139264)
@@ -275,7 +265,6 @@ class TestBitfieldSwitches:
         # Should set bit 10: 139264 | 1024 = 140288
         coordinator.async_set_param.assert_called_once_with("231", 140288)
 
-    @pytest.mark.asyncio
     async def test_bitfield_turn_off_clears_bit(self, coordinator: EconextCoordinator) -> None:
         """Test turning off a bitfield switch clears the correct bit."""
         # Start with bits 10, 13, and 17 set (140288)
@@ -294,7 +283,6 @@ class TestBitfieldSwitches:
         # Should clear bit 10: 140288 & ~1024 = 139264
         coordinator.async_set_param.assert_called_once_with("231", 139264)
 
-    @pytest.mark.asyncio
     async def test_bitfield_inverted_turn_on_clears_bit(self, coordinator: EconextCoordinator) -> None:
         """Test turning on inverted bitfield switch clears the bit."""
         # Start with bit 20 set (1048576)
@@ -313,7 +301,6 @@ class TestBitfieldSwitches:
         # Should clear bit 20 (inverted logic): 1048576 & ~1048576 = 0
         coordinator.async_set_param.assert_called_once_with("231", 0)
 
-    @pytest.mark.asyncio
     async def test_bitfield_inverted_turn_off_sets_bit(self, coordinator: EconextCoordinator) -> None:
         """Test turning off inverted bitfield switch sets the bit."""
         # Start with no bits set